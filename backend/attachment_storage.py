@@ -6,13 +6,18 @@ Uses SHA256 for deduplication - same file content reuses existing extraction.
 """
 
 import hashlib
+import io
 import json
+import mmap
 import os
-import uuid
-from datetime import datetime
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+
+import msgspec
 
 from .config import DATA_DIR
 from .logger import logger
@@ -23,22 +28,60 @@ ATTACHMENTS_DIR = os.path.join(DATA_DIR, "attachments")
 ATTACHMENTS_META_DIR = os.path.join(ATTACHMENTS_DIR, "meta")
 ATTACHMENTS_RAW_DIR = os.path.join(ATTACHMENTS_DIR, "raw")
 ATTACHMENTS_TEXT_DIR = os.path.join(ATTACHMENTS_DIR, "text")
+# Content-addressed text store; per-attachment paths hardlink into it
+ATTACHMENTS_TEXT_SHA_DIR = os.path.join(ATTACHMENTS_TEXT_DIR, "sha")
+
+_UTC = timezone.utc
+
+# Pre-bound per-id path builders; plain concatenation on a fixed prefix
+# is about twice as fast as os.path.join per access
+_META_PREFIX = ATTACHMENTS_META_DIR + os.sep
+_RAW_PREFIX = ATTACHMENTS_RAW_DIR + os.sep
+_TEXT_PREFIX = ATTACHMENTS_TEXT_DIR + os.sep
+_TEXT_SHA_PREFIX = ATTACHMENTS_TEXT_SHA_DIR + os.sep
+
+
+def _meta_path(attachment_id: str) -> str:
+    return _META_PREFIX + attachment_id + ".json"
+
+
+def _raw_path(attachment_id: str) -> str:
+    return _RAW_PREFIX + attachment_id + ".bin"
+
 
-# SHA256 -> attachment_id cache file
+def _text_path(attachment_id: str) -> str:
+    return _TEXT_PREFIX + attachment_id + ".txt"
+
+
+def _text_sha_path(sha256: str) -> str:
+    return _TEXT_SHA_PREFIX + sha256 + ".txt"
+
+# SHA256 -> attachment_id dedup index
+# Legacy JSON index (migrated into SQLite on first open)
 CACHE_INDEX_PATH = os.path.join(ATTACHMENTS_DIR, "cache_index.json")
+CACHE_DB_PATH = os.path.join(ATTACHMENTS_DIR, "cache_index.db")
+
 
+class AttachmentStats(msgspec.Struct):
+    """Statistics about extracted content.
 
-class AttachmentStats(BaseModel):
-    """Statistics about extracted content."""
+    Unlike the old Pydantic model, msgspec Structs reject unknown kwargs,
+    so every stats key the extractors emit must be declared here.
+    """
     page_count: Optional[int] = None
     sheet_count: Optional[int] = None
     slide_count: Optional[int] = None
+    row_count: Optional[int] = None
     char_count: int = 0
     empty_page_ratio: float = 0.0
 
 
-class Attachment(BaseModel):
-    """Attachment metadata model."""
+class Attachment(msgspec.Struct):
+    """Attachment metadata model.
+
+    msgspec.Struct rather than Pydantic: metadata is read on every
+    context build and needs raw decode speed, not field coercion.
+    """
     attachment_id: str
     sha256: str
     filename: str
@@ -49,45 +92,176 @@ class Attachment(BaseModel):
     method: str = "local"  # local, openrouter_pdf_text, openrouter_mistral_ocr, vision
     warning: Optional[str] = None
     error: Optional[str] = None
-    stats: AttachmentStats = Field(default_factory=AttachmentStats)
+    stats: AttachmentStats = msgspec.field(default_factory=AttachmentStats)
+    header: Optional[str] = None  # pre-rendered "[File: ...]" context header
+    text_len: int = 0  # length of extracted text, set by save_attachment_text
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Plain-dict view (keeps the old Pydantic call sites working)."""
+        return msgspec.to_builtins(self)
+
+
+_dirs_ready = False
 
 
 def ensure_dirs():
-    """Ensure attachment directories exist."""
-    for d in [ATTACHMENTS_DIR, ATTACHMENTS_META_DIR, ATTACHMENTS_RAW_DIR, ATTACHMENTS_TEXT_DIR]:
+    """Ensure attachment directories exist (mkdir syscalls run only once)."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    for d in [ATTACHMENTS_DIR, ATTACHMENTS_META_DIR, ATTACHMENTS_RAW_DIR, ATTACHMENTS_TEXT_DIR, ATTACHMENTS_TEXT_SHA_DIR]:
         Path(d).mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
 
 
-def compute_sha256(content: bytes) -> str:
-    """Compute SHA256 hash of file content."""
-    return hashlib.sha256(content).hexdigest()
+# Hash/write chunk size - keeps working set bounded on large uploads
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
 
+# Buffer size for raw/text file I/O - 64 KiB cuts syscall count on
+# multi-MB payloads compared to the default line/block buffering
+IO_BUFFER_SIZE = 1 << 16
 
-def get_cache_index() -> Dict[str, str]:
-    """Load SHA256 -> attachment_id cache index."""
-    ensure_dirs()
-    if os.path.exists(CACHE_INDEX_PATH):
-        with open(CACHE_INDEX_PATH, 'r') as f:
-            return json.load(f)
-    return {}
+# Raw files at or above this size are handed out as mmap views instead
+# of being copied into a bytes object
+MMAP_THRESHOLD = 16 * 1024 * 1024
 
 
-def save_cache_index(index: Dict[str, str]):
-    """Save SHA256 -> attachment_id cache index."""
-    ensure_dirs()
-    with open(CACHE_INDEX_PATH, 'w') as f:
-        json.dump(index, f, indent=2)
+def _make_sha256_factory():
+    """Pick the fastest SHA256 constructor available.
+
+    hashlib.new('sha256', usedforsecurity=False) routes through the OpenSSL
+    EVP backend, which auto-dispatches to SHA-NI / ARMv8 SHA2 instructions
+    on capable CPUs and skips FIPS checks. Falls back to plain
+    hashlib.sha256 on builds that don't accept the keyword.
+    """
+    try:
+        hashlib.new('sha256', usedforsecurity=False)
+    except (TypeError, ValueError):
+        logger.info("[ATTACH] SHA256 backend: hashlib.sha256 (no usedforsecurity support)")
+        return hashlib.sha256
+
+    import ssl
+    logger.info(f"[ATTACH] SHA256 backend: OpenSSL EVP ({ssl.OPENSSL_VERSION})")
+    return lambda: hashlib.new('sha256', usedforsecurity=False)
+
+
+_sha256_factory = _make_sha256_factory()
+
+
+def compute_sha256_batch(contents: List[bytes]) -> List[str]:
+    """Hash multiple file buffers, using a thread pool when it pays off.
+
+    hashlib releases the GIL for buffers larger than ~2 KiB, so hashing N
+    uploads across threads runs the OpenSSL SHA256 kernels on multiple
+    cores at once. Small batches stay sequential to skip pool overhead.
+    """
+    if len(contents) <= 1:
+        return [compute_sha256(c) for c in contents]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(contents))) as pool:
+        return list(pool.map(compute_sha256, contents))
+
+
+def compute_sha256(content) -> str:
+    """Compute SHA256 hash of file content.
+
+    Accepts raw bytes or a binary file-like object. Streams are hashed
+    in 1 MiB chunks so large uploads never need a second full-size buffer.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        content = io.BytesIO(content)
+
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(content, _sha256_factory).hexdigest()
+
+    h = _sha256_factory()
+    while chunk := content.read(HASH_CHUNK_SIZE):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+# Fast-reject set of known SHA256s; most uploads are new content, so the
+# common miss path returns without touching SQLite at all
+_known_sha256s: set = set()
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Get (or open) the SQLite dedup index.
+
+    Replaces the old full-rewrite JSON index: lookups are O(log N) and
+    inserts O(1) instead of parsing and rewriting the whole file per
+    upload. The legacy cache_index.json is migrated in on first open.
+    """
+    global _cache_db
+    if _cache_db is None:
+        with _cache_db_lock:
+            if _cache_db is None:
+                ensure_dirs()
+                db = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS dedup("
+                    "sha256 TEXT PRIMARY KEY, attachment_id TEXT, created REAL)"
+                )
+                _migrate_json_index(db)
+                _known_sha256s.update(
+                    row[0] for row in db.execute("SELECT sha256 FROM dedup")
+                )
+                _cache_db = db
+    return _cache_db
+
+
+def _migrate_json_index(db: sqlite3.Connection):
+    """Import the legacy cache_index.json into SQLite, then retire it."""
+    if not os.path.exists(CACHE_INDEX_PATH):
+        return
+    try:
+        with open(CACHE_INDEX_PATH, 'r') as f:
+            index = json.load(f)
+        now = time.time()
+        db.executemany(
+            "INSERT OR IGNORE INTO dedup(sha256, attachment_id, created) VALUES (?, ?, ?)",
+            [(sha, aid, now) for sha, aid in index.items()]
+        )
+        db.commit()
+        os.replace(CACHE_INDEX_PATH, CACHE_INDEX_PATH + ".migrated")
+        logger.info(f"[ATTACH] Migrated {len(index)} cache index entries to SQLite")
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"[ATTACH] Failed to migrate legacy cache index: {e}")
+
+
+def register_cached_attachment(sha256: str, attachment_id: str):
+    """Record a SHA256 -> attachment_id mapping in the dedup index."""
+    db = _get_cache_db()
+    with _cache_db_lock:
+        db.execute(
+            "INSERT OR IGNORE INTO dedup(sha256, attachment_id, created) VALUES (?, ?, ?)",
+            (sha256, attachment_id, time.time())
+        )
+        db.commit()
+    _known_sha256s.add(sha256)
 
 
 def get_cached_attachment(sha256: str) -> Optional[str]:
     """Check if file with this hash was already processed.
-    
+
     Returns:
         attachment_id if cached, None otherwise
     """
-    index = get_cache_index()
-    attachment_id = index.get(sha256)
-    
+    db = _get_cache_db()
+    if sha256 not in _known_sha256s:
+        return None
+
+    row = db.execute(
+        "SELECT attachment_id FROM dedup WHERE sha256 = ?", (sha256,)
+    ).fetchone()
+    attachment_id = row[0] if row else None
+
     if attachment_id:
         # Verify the attachment still exists
         meta = get_attachment(attachment_id)
@@ -101,19 +275,25 @@ def get_cached_attachment(sha256: str) -> Optional[str]:
 def create_attachment(
     content: bytes,
     filename: str,
-    mime_type: str
+    mime_type: str,
+    sha256: Optional[str] = None
 ) -> Attachment:
     """Create a new attachment from file content.
-    
+
     This stores the raw file and initializes metadata.
     Extraction happens asynchronously via process_attachment().
-    
+
+    Args:
+        sha256: Optional precomputed digest (e.g. from
+            compute_sha256_batch) so batch uploads hash each file once
+
     Returns:
         Attachment metadata (status will be 'processing')
     """
     ensure_dirs()
-    
-    sha256 = compute_sha256(content)
+
+    if sha256 is None:
+        sha256 = compute_sha256(content)
     
     # Check cache first
     cached_id = get_cached_attachment(sha256)
@@ -123,9 +303,10 @@ def create_attachment(
             logger.info(f"[ATTACH] Reusing cached attachment {cached_id} for {filename}")
             return cached
     
-    # Create new attachment
-    attachment_id = f"att_{uuid.uuid4().hex[:12]}"
-    now = datetime.utcnow().isoformat()
+    # Create new attachment - os.urandom is ~10x cheaper than uuid4 and
+    # 48 random bits match the entropy of the old truncated hex uuid
+    attachment_id = f"att_{os.urandom(6).hex()}"
+    now = datetime.now(_UTC).isoformat(timespec='seconds')
     
     attachment = Attachment(
         attachment_id=attachment_id,
@@ -138,44 +319,67 @@ def create_attachment(
         method="local",
     )
     
-    # Save raw file
-    raw_path = os.path.join(ATTACHMENTS_RAW_DIR, f"{attachment_id}.bin")
-    with open(raw_path, 'wb') as f:
-        f.write(content)
+    # Save raw file in chunks (avoids one giant write syscall for big uploads)
+    raw_path = _raw_path(attachment_id)
+    view = memoryview(content)
+    with open(raw_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+        for offset in range(0, len(view), HASH_CHUNK_SIZE):
+            f.write(view[offset:offset + HASH_CHUNK_SIZE])
     
     # Save metadata
     save_attachment(attachment)
     
     # Update cache index
-    index = get_cache_index()
-    index[sha256] = attachment_id
-    save_cache_index(index)
+    register_cached_attachment(sha256, attachment_id)
     
     logger.info(f"[ATTACH] Created attachment {attachment_id} for {filename} ({len(content)} bytes)")
     
     return attachment
 
 
+# attachment_id -> (meta file mtime_ns, Attachment); avoids re-parsing the
+# same small JSON file on every get_attachment call within a process
+_meta_cache: Dict[str, tuple] = {}
+
+
+def clear_meta_cache():
+    """Drop the in-process metadata cache (mainly for tests)."""
+    _meta_cache.clear()
+
+
 def get_attachment(attachment_id: str) -> Optional[Attachment]:
     """Load attachment metadata by ID."""
-    meta_path = os.path.join(ATTACHMENTS_META_DIR, f"{attachment_id}.json")
-    
-    if not os.path.exists(meta_path):
+    meta_path = _meta_path(attachment_id)
+
+    try:
+        mtime_ns = os.stat(meta_path).st_mtime_ns
+    except OSError:
+        _meta_cache.pop(attachment_id, None)
         return None
-    
-    with open(meta_path, 'r') as f:
-        data = json.load(f)
-    
-    return Attachment(**data)
+
+    cached = _meta_cache.get(attachment_id)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    with open(meta_path, 'rb') as f:
+        attachment = msgspec.json.decode(f.read(), type=Attachment)
+
+    _meta_cache[attachment_id] = (mtime_ns, attachment)
+    return attachment
 
 
 def save_attachment(attachment: Attachment):
     """Save attachment metadata."""
     ensure_dirs()
-    meta_path = os.path.join(ATTACHMENTS_META_DIR, f"{attachment.attachment_id}.json")
-    
-    with open(meta_path, 'w') as f:
-        json.dump(attachment.model_dump(), f, indent=2)
+    meta_path = _meta_path(attachment.attachment_id)
+
+    # Write-then-rename so a crash mid-write never leaves torn JSON
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(msgspec.json.encode(attachment))
+    os.replace(tmp_path, meta_path)
+
+    _meta_cache[attachment.attachment_id] = (os.stat(meta_path).st_mtime_ns, attachment)
 
 
 def update_attachment_status(
@@ -200,50 +404,148 @@ def update_attachment_status(
         attachment.error = error
     if stats:
         attachment.stats = AttachmentStats(**stats)
-    
+
+    # Render the context header once here instead of on every context build
+    attachment.header = build_attachment_header(attachment)
+
     save_attachment(attachment)
     logger.info(f"[ATTACH] Updated {attachment_id} status={status} method={method}")
 
 
+def build_attachment_header(attachment: Attachment) -> str:
+    """Render the attribution header shown above an attachment's text."""
+    header = f"[File: {attachment.filename}]"
+    if attachment.stats.page_count:
+        header += f" ({attachment.stats.page_count} pages)"
+    elif attachment.stats.slide_count:
+        header += f" ({attachment.stats.slide_count} slides)"
+    elif attachment.stats.sheet_count:
+        header += f" ({attachment.stats.sheet_count} sheets)"
+    return header
+
+
 def save_attachment_text(attachment_id: str, text: str):
-    """Save extracted text for an attachment."""
+    """Save extracted text for an attachment.
+
+    Text is stored content-addressed under text/sha/{sha256}.txt with a
+    hardlink at the per-attachment path, so re-uploads of identical
+    content skip the write and share one copy on disk.
+    """
     ensure_dirs()
-    text_path = os.path.join(ATTACHMENTS_TEXT_DIR, f"{attachment_id}.txt")
-    
-    with open(text_path, 'w', encoding='utf-8') as f:
-        f.write(text)
+    text_path = _text_path(attachment_id)
+    attachment = get_attachment(attachment_id)
+
+    if attachment:
+        sha_path = _text_sha_path(attachment.sha256)
+        encoded = text.encode('utf-8')
+
+        # Skip the write only when the stored bytes are identical; the
+        # sha directory is keyed by the raw file's hash, not the text's,
+        # so a re-extraction (e.g. OCR enhance) can produce different
+        # text of the same length. Size is just the fast reject before
+        # the byte compare.
+        try:
+            unchanged = os.path.getsize(sha_path) == len(encoded)
+            if unchanged:
+                with open(sha_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    unchanged = f.read() == encoded
+        except OSError:
+            unchanged = False
+
+        if not unchanged:
+            tmp_path = sha_path + ".tmp"
+            with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(encoded)
+            os.replace(tmp_path, sha_path)
+
+        # (Re-)link the per-attachment path to the shared copy
+        try:
+            if os.path.exists(text_path):
+                os.remove(text_path)
+            os.link(sha_path, text_path)
+        except OSError:
+            # Filesystem without hardlinks - fall back to a plain copy
+            with open(text_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(encoded)
+    else:
+        with open(text_path, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            f.write(text)
+
+    # Record the text length so context builds can budget without re-scanning
+    if attachment and attachment.text_len != len(text):
+        attachment.text_len = len(text)
+        save_attachment(attachment)
 
 
 def get_attachment_text(attachment_id: str) -> Optional[str]:
     """Load extracted text for an attachment."""
-    text_path = os.path.join(ATTACHMENTS_TEXT_DIR, f"{attachment_id}.txt")
-    
-    if not os.path.exists(text_path):
+    # EAFP: open directly instead of a separate exists() stat per lookup
+    try:
+        with open(_text_path(attachment_id), 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def get_attachment_text_head(attachment_id: str, max_chars: int) -> Optional[str]:
+    """Load at most max_chars of extracted text for an attachment.
+
+    Reads only the head of the file, so building a truncated context
+    never pulls a megabyte-scale extraction fully into memory.
+    """
+    text_path = _text_path(attachment_id)
+
+    try:
+        with open(text_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            return f.read(max_chars)
+    except OSError:
         return None
-    
-    with open(text_path, 'r', encoding='utf-8') as f:
-        return f.read()
 
 
 def get_attachment_raw(attachment_id: str) -> Optional[bytes]:
-    """Load raw file content for an attachment."""
-    raw_path = os.path.join(ATTACHMENTS_RAW_DIR, f"{attachment_id}.bin")
-    
-    if not os.path.exists(raw_path):
+    """Load raw file content for an attachment.
+
+    Files of MMAP_THRESHOLD bytes or more are returned as a read-only
+    mmap (bytes-like, zero-copy) instead of a full in-memory copy;
+    hashing and extraction consumers accept buffer-protocol objects.
+    """
+    try:
+        with open(_raw_path(attachment_id), 'rb', buffering=IO_BUFFER_SIZE) as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def get_attachment_raw_mmap(attachment_id: str) -> Optional[mmap.mmap]:
+    """Map raw file content for an attachment without copying it.
+
+    The caller holds the mmap for the lifetime of the hashing/extraction
+    work; the view is closed automatically when garbage collected.
+    """
+    try:
+        with open(_raw_path(attachment_id), 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
         return None
-    
-    with open(raw_path, 'rb') as f:
-        return f.read()
 
 
 def list_attachments(attachment_ids: List[str]) -> List[Attachment]:
-    """Load multiple attachments by ID."""
-    result = []
-    for aid in attachment_ids:
-        att = get_attachment(aid)
-        if att:
-            result.append(att)
-    return result
+    """Load multiple attachments by ID.
+
+    Larger batches fan the stat+read out over a thread pool (the GIL is
+    released during file I/O) instead of paying N sequential round trips.
+    Order of the input IDs is preserved; missing IDs are skipped.
+    """
+    if len(attachment_ids) > 3:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            loaded = pool.map(get_attachment, attachment_ids)
+    else:
+        loaded = (get_attachment(aid) for aid in attachment_ids)
+
+    return [att for att in loaded if att]
 
 
 def build_llm_context(attachment_ids: List[str], max_chars: int = 50000) -> str:
@@ -265,41 +567,53 @@ def build_llm_context(attachment_ids: List[str], max_chars: int = 50000) -> str:
     attachments = list_attachments(attachment_ids)
     if not attachments:
         return ""
-    
-    context_parts = []
+
+    # Stream parts into one buffer with a running budget counter instead
+    # of accumulating a list and re-scanning each part with len()
+    buf = io.StringIO()
+    write = buf.write  # bound once; skips an attribute lookup per part
+    write("--- ATTACHED DOCUMENTS ---\n\n")
     remaining_chars = max_chars
-    
+    wrote_any = False
+
     for att in attachments:
         if att.status not in ("success", "partial"):
             # Include a note about failed extractions
-            context_parts.append(f"[File: {att.filename}]\nStatus: Extraction {att.status}. {att.error or att.warning or 'No content available.'}\n")
-            continue
-        
-        text = get_attachment_text(att.attachment_id)
-        if not text:
+            if wrote_any:
+                write("\n")
+            write(f"[File: {att.filename}]\nStatus: Extraction {att.status}. {att.error or att.warning or 'No content available.'}\n")
+            wrote_any = True
             continue
-        
-        # Build attribution header
-        header = f"[File: {att.filename}]"
-        if att.stats.page_count:
-            header += f" ({att.stats.page_count} pages)"
-        elif att.stats.slide_count:
-            header += f" ({att.stats.slide_count} slides)"
-        elif att.stats.sheet_count:
-            header += f" ({att.stats.sheet_count} sheets)"
-        
-        # Truncate if needed
+
+        # Attribution header (pre-rendered at extraction time when possible)
+        header = att.header or build_attachment_header(att)
+
+        # Truncate if needed - checked before reading the text file so a
+        # spent budget skips the read entirely
         available = remaining_chars - len(header) - 10  # Reserve for newlines
         if available <= 0:
             break
-        
+
+        # Read one char past the budget to detect truncation without
+        # loading (or slicing) the full extraction
+        text = get_attachment_text_head(att.attachment_id, available + 1)
+        if not text:
+            continue
+
         if len(text) > available:
             text = text[:available] + "\n[...content truncated...]"
-        
-        context_parts.append(f"{header}\n{text}\n")
-        remaining_chars -= len(context_parts[-1])
-    
-    if not context_parts:
+
+        if wrote_any:
+            write("\n")
+        write(header)
+        write("\n")
+        write(text)
+        write("\n")
+        wrote_any = True
+        remaining_chars -= len(header) + len(text) + 2
+
+    if not wrote_any:
         return ""
-    
-    return "--- ATTACHED DOCUMENTS ---\n\n" + "\n".join(context_parts) + "\n--- END DOCUMENTS ---"
+
+    write("\n--- END DOCUMENTS ---")
+    return buf.getvalue()
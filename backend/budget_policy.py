@@ -1,67 +1,75 @@
 """Budget Policy: Decision rules for resource allocation based on budget status."""
 
+from bisect import bisect_left
 from typing import Dict, Any, Tuple
-from .config import BUDGET_POLICY, RAG_SETTINGS
+from .config import BUDGET_POLICY, RAG_SETTINGS, get_preset
 from .logger import logger
 
 
+# Bracket boundaries (fraction of budget spent); bracket i applies up to
+# and including threshold i, with one extra bracket for over-budget
+BRACKET_THRESHOLDS = (0.70, 0.85, 1.00)
+BRACKET_NAMES = ("normal", "balanced", "reduced", "minimal")
+
+
 def get_policy_bracket(spent_pct: float) -> str:
     """
     Determine which budget policy bracket applies.
-    
+
     Args:
         spent_pct: Percentage of budget spent (0.0 to N, can exceed 1.0)
-        
+
     Returns:
         Bracket name: "normal", "balanced", "reduced", "minimal"
     """
     if spent_pct is None:
         return "normal"
-    
-    pct = spent_pct * 100  # Convert to percentage
-    
-    if pct <= 70:
-        return "normal"
-    elif pct <= 85:
-        return "balanced"
-    elif pct <= 100:
-        return "reduced"
-    else:
-        return "minimal"
+
+    return BRACKET_NAMES[bisect_left(BRACKET_THRESHOLDS, spent_pct)]
+
+
+# Per-bracket policy settings, built once at import instead of per call
+_POLICIES: Dict[str, Dict[str, Any]] = {
+    "normal": {
+        "rag_preset": "auto",
+        "mode": "from_task",  # Use task signal
+        "allow_council": True,
+    },
+    "balanced": {
+        "rag_preset": "medium",
+        "mode": "standard",
+        "allow_council": True,
+    },
+    "reduced": {
+        "rag_preset": "low",
+        "mode": "quick",
+        "allow_council": False,  # Suggest chat instead
+    },
+    "minimal": {
+        "rag_preset": "low",
+        "mode": "quick",
+        "allow_council": False,
+    },
+}
+
+# Task signal -> RAG preset mapping for the "auto" preset
+_TASK_TO_PRESET = {
+    "quick": "low",
+    "standard": "medium",
+    "research": "high",
+}
 
 
 def get_policy_settings(bracket: str) -> Dict[str, Any]:
     """
     Get policy settings for a budget bracket.
-    
+
     Returns dict with:
         - rag_preset: RAG budget preset
         - mode: Execution mode
         - allow_council: Whether council mode is allowed
     """
-    policies = {
-        "normal": {
-            "rag_preset": "auto",
-            "mode": "from_task",  # Use task signal
-            "allow_council": True,
-        },
-        "balanced": {
-            "rag_preset": "medium",
-            "mode": "standard",
-            "allow_council": True,
-        },
-        "reduced": {
-            "rag_preset": "low",
-            "mode": "quick",
-            "allow_council": False,  # Suggest chat instead
-        },
-        "minimal": {
-            "rag_preset": "low",
-            "mode": "quick",
-            "allow_council": False,
-        },
-    }
-    return policies.get(bracket, policies["normal"])
+    return _POLICIES.get(bracket, _POLICIES["normal"])
 
 
 def apply_budget_policy(
@@ -92,15 +100,9 @@ def apply_budget_policy(
     # Get RAG tokens
     rag_preset = settings["rag_preset"]
     if rag_preset == "auto":
-        # Map task signal to preset
-        task_to_preset = {
-            "quick": "low",
-            "standard": "medium",
-            "research": "high",
-        }
-        rag_preset = task_to_preset.get(task_signal, "medium")
+        rag_preset = _TASK_TO_PRESET.get(task_signal, "medium")
     
-    rag_tokens = RAG_SETTINGS["presets"].get(rag_preset, {}).get("tokens", 8000)
+    rag_tokens = get_preset(rag_preset)["tokens"]
     
     policy_reason = f"budget_{bracket}"
     
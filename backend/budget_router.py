@@ -3,7 +3,8 @@
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
-from .config import RAG_SETTINGS, BUDGET_POLICY, TASK_SIGNALS
+from .config import RAG_SETTINGS, BUDGET_POLICY, TASK_SIGNALS, get_preset
+from .budget_policy import get_policy_bracket
 from .rag_utils import detect_task_signal, get_budget_for_task_signal
 from .storage import get_session_policy, get_session_usage, get_budget_spent_percentage
 from .execution_modes import get_execution_mode, select_chairman_for_tier
@@ -26,6 +27,20 @@ class RunPlan:
         return asdict(self)
 
 
+# Per-bracket routing decisions; "normal" routes from the task signal
+_BRACKET_REASONS = {
+    "normal": "budget_under_70",
+    "balanced": "budget_70_85",
+    "reduced": "budget_85_100",
+    "minimal": "budget_over_100",
+}
+_BRACKET_PLANS = {
+    "balanced": ("medium", "standard"),
+    "reduced": ("low", "quick"),
+    "minimal": ("low", "quick"),
+}
+
+
 def create_run_plan(
     query: str,
     conversation_id: str,
@@ -60,28 +75,16 @@ def create_run_plan(
         rag_tokens, rag_preset = get_budget_for_task_signal(task_signal)
         mode = task_signal
     else:
-        # Apply budget policy
-        pct = budget_pct * 100  # Convert to percentage
-        
-        if pct <= 70:
-            policy_reason = "budget_under_70"
+        # Apply budget policy via the shared bracket table
+        bracket = get_policy_bracket(budget_pct)
+        policy_reason = _BRACKET_REASONS[bracket]
+
+        if bracket == "normal":
             rag_tokens, rag_preset = get_budget_for_task_signal(task_signal)
             mode = task_signal
-        elif pct <= 85:
-            policy_reason = "budget_70_85"
-            rag_preset = "medium"
-            rag_tokens = RAG_SETTINGS["presets"]["medium"]["tokens"]
-            mode = "standard"
-        elif pct <= 100:
-            policy_reason = "budget_85_100"
-            rag_preset = "low"
-            rag_tokens = RAG_SETTINGS["presets"]["low"]["tokens"]
-            mode = "quick"
         else:
-            policy_reason = "budget_over_100"
-            rag_preset = "low"
-            rag_tokens = RAG_SETTINGS["presets"]["low"]["tokens"]
-            mode = "quick"
+            rag_preset, mode = _BRACKET_PLANS[bracket]
+            rag_tokens = get_preset(rag_preset)["tokens"]
     
     # 4. Estimate cost (simplified - Phase 2 uses rough estimate)
     predicted_cost = estimate_message_cost(mode, rag_tokens, chairman_model)
@@ -115,29 +118,21 @@ def estimate_message_cost(mode: str, rag_tokens: int, chairman_model: str = None
     
     This is intentionally conservative (overestimates).
     """
-    from .config import CURATED_MODELS
-    
+    from .config import MODEL_PRICES
+
     # Base token estimates by mode
     mode_estimates = {
         "quick": {"input": 2000, "output": 500},
         "standard": {"input": 4000, "output": 1000},
         "research": {"input": 8000, "output": 2000},
     }
-    
+
     estimate = mode_estimates.get(mode, mode_estimates["standard"])
     total_input = estimate["input"] + rag_tokens
     total_output = estimate["output"]
-    
-    # Get pricing for chairman model
-    input_price = 1.0  # Default $/M
-    output_price = 5.0
-    
-    if chairman_model:
-        model_config = next((m for m in CURATED_MODELS if m["id"] == chairman_model), None)
-        if model_config:
-            pricing = model_config.get("pricing", {})
-            input_price = pricing.get("input", 1.0)
-            output_price = pricing.get("output", 5.0)
-    
+
+    # O(1) pricing lookup; conservative defaults for unknown models
+    input_price, output_price = MODEL_PRICES.get(chairman_model, (1.0, 5.0))
+
     cost = (total_input / 1_000_000) * input_price + (total_output / 1_000_000) * output_price
     return round(cost, 6)
@@ -0,0 +1,113 @@
+"""Exact-match prompt cache for council LLM calls.
+
+Repeated or re-run queries re-fire the same (model, prompt) pairs at
+OpenRouter; serving those from a local store removes entire network
+round-trips, which dominate council latency and cost. Keys are SHA-256
+over model + prompt, rows carry a TTL, and the store is SQLite in WAL
+mode (same pattern as the attachment dedup index).
+
+Opt-in via COUNCIL_CACHE=1 so interactive deployments that want fresh
+responses per turn are unaffected.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .config import DATA_DIR
+from .logger import logger
+
+
+PROMPT_CACHE_DB_PATH = os.path.join(DATA_DIR, "prompt_cache.db")
+
+# Cached responses stay valid for a day; council answers are not
+# time-critical beyond that horizon
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def cache_enabled() -> bool:
+    """Whether the prompt cache is active for this process."""
+    return os.environ.get("COUNCIL_CACHE") == "1"
+
+
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_db_lock = threading.Lock()
+
+
+def _get_cache_db() -> sqlite3.Connection:
+    """Get (or open) the SQLite prompt cache."""
+    global _cache_db
+    if _cache_db is None:
+        with _cache_db_lock:
+            if _cache_db is None:
+                os.makedirs(DATA_DIR, exist_ok=True)
+                db = sqlite3.connect(PROMPT_CACHE_DB_PATH, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS prompt_cache ("
+                    "  key TEXT PRIMARY KEY,"
+                    "  response TEXT NOT NULL,"
+                    "  created REAL NOT NULL"
+                    ")"
+                )
+                db.commit()
+                _cache_db = db
+    return _cache_db
+
+
+def _prompt_key(model: str, prompt: str) -> str:
+    """Stable cache key over (model, prompt)."""
+    return hashlib.sha256((model + "\x00" + prompt).encode()).hexdigest()
+
+
+def messages_fingerprint(messages: List[Dict[str, str]]) -> str:
+    """Serialize a message list into a deterministic prompt string."""
+    return "\x1e".join(
+        f"{m.get('role', '')}\x1f{m.get('content', '')}" for m in messages
+    )
+
+
+def get_cached_response(model: str, prompt: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached response; None on miss or expiry."""
+    db = _get_cache_db()
+    with _cache_db_lock:
+        row = db.execute(
+            "SELECT response, created FROM prompt_cache WHERE key = ?",
+            (_prompt_key(model, prompt),),
+        ).fetchone()
+    if row is None:
+        return None
+    response_json, created = row
+    if time.time() - created > CACHE_TTL_SECONDS:
+        return None
+    try:
+        return json.loads(response_json)
+    except (ValueError, TypeError):
+        return None
+
+
+def store_response(model: str, prompt: str, response: Dict[str, Any]) -> None:
+    """Persist a model response for future exact-match hits."""
+    payload = json.dumps({
+        "content": response.get("content", ""),
+        "usage": response.get("usage", {}),
+    })
+    db = _get_cache_db()
+    with _cache_db_lock:
+        db.execute(
+            "INSERT OR REPLACE INTO prompt_cache (key, response, created) VALUES (?, ?, ?)",
+            (_prompt_key(model, prompt), payload, time.time()),
+        )
+        db.commit()
+
+
+def clear_prompt_cache() -> None:
+    """Drop all cached responses (used by tests)."""
+    db = _get_cache_db()
+    with _cache_db_lock:
+        db.execute("DELETE FROM prompt_cache")
+        db.commit()
@@ -1,19 +1,46 @@
 """Configuration for the LLM Council."""
 
+from __future__ import annotations
+
+import bisect
+import functools
 import os
+import re
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
-load_dotenv()
 
-# OpenRouter API key
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+@functools.cache
+def get_api_key(required: bool = True) -> str | None:
+    """Resolve the OpenRouter API key, parsing .env at most once per process.
 
-if not OPENROUTER_API_KEY:
-    raise ValueError(
-        "OPENROUTER_API_KEY environment variable is not set. "
-        "Please add it to your .env file. "
-        "Get your API key at https://openrouter.ai/"
-    )
+    Real environment variables win (the production container case); .env is
+    only consulted when the key is absent, so reimports and test harnesses
+    never re-parse the file. Validation happens here, on first API use,
+    rather than at import — tools that import config without credentials
+    (tests, lint hooks) no longer blow up.
+    """
+    if "OPENROUTER_API_KEY" not in os.environ:
+        load_dotenv(override=False)
+    key = os.environ.get("OPENROUTER_API_KEY")
+    if not key and required:
+        raise ValueError(
+            "OPENROUTER_API_KEY environment variable is not set. "
+            "Please add it to your .env file. "
+            "Get your API key at https://openrouter.ai/"
+        )
+    return key
+
+
+def __getattr__(name: str):
+    # PEP 562: legacy `config.OPENROUTER_API_KEY` reads resolve lazily
+    # through get_api_key() on first access
+    if name == "OPENROUTER_API_KEY":
+        return get_api_key()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Council members - list of OpenRouter model identifiers
 COUNCIL_MODELS = [
@@ -46,7 +73,31 @@ REASONING_MODELS = {
 # - capabilities: Custom tags for filtering
 # - type: chairman (synthesis), council (deliberation), or both
 # - pricing/name: Fetched live from OpenRouter API (fallback values kept for offline use)
-CURATED_MODELS = [
+@dataclass(frozen=True, slots=True)
+class ModelSpec:
+    """Immutable curated-model record; slots keep instances dict-free."""
+    id: str
+    name: str
+    type: str
+    capabilities: tuple[str, ...]
+    caps_mask: int
+    input_price: float
+    output_price: float
+
+    def as_dict(self) -> dict:
+        """Legacy dict shape, used only on cold admin/UI paths."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "capabilities": list(self.capabilities),
+            "pricing": {"input": self.input_price, "output": self.output_price},
+        }
+
+
+# Source table kept as dict literals for easy editing; frozen into
+# ModelSpec records below so hot paths get slot reads, not dict hashing
+_CURATED_MODEL_DATA = [
     # ============================================
     # CHAIRMAN TIER (highest quality, use sparingly)
     # ============================================
@@ -115,6 +166,56 @@ CURATED_MODELS = [
     {"id": "mistralai/devstral-2512:free", "capabilities": ["coding", "free"], "type": "council", "name": "Devstral 2512 (Free)", "pricing": {"input": 0.0, "output": 0.0}},
 ]
 
+# One bit per distinct capability tag, so capability filtering is an
+# integer AND per model instead of nested string comparisons
+CAPABILITY_BITS = {
+    c: 1 << i
+    for i, c in enumerate(sorted({c for m in _CURATED_MODEL_DATA for c in m["capabilities"]}))
+}
+
+
+def caps_to_mask(caps) -> int:
+    """Fold capability names into a bitmask; unknown tags are ignored."""
+    mask = 0
+    for c in caps:
+        mask |= CAPABILITY_BITS.get(c, 0)
+    return mask
+
+
+CURATED_MODELS = tuple(
+    ModelSpec(
+        id=m["id"],
+        name=m["name"],
+        type=m["type"],
+        capabilities=tuple(m["capabilities"]),
+        caps_mask=caps_to_mask(m["capabilities"]),
+        input_price=m["pricing"]["input"],
+        output_price=m["pricing"]["output"],
+    )
+    for m in _CURATED_MODEL_DATA
+)
+
+# The dict source table (and its many duplicate pricing dicts, e.g. the
+# shared free-tier and Gemini price points) is only needed to build the
+# specs; dropping it returns those allocations to the heap
+del _CURATED_MODEL_DATA
+
+# O(1) lookup index over CURATED_MODELS (avoids linear scans per request)
+MODEL_BY_ID = {m.id: m for m in CURATED_MODELS}
+
+# Pre-bucketed views so "all chairman models" / "all council models" is a
+# tuple read instead of an O(N) filter per request
+CHAIRMAN_MODELS = tuple(m for m in CURATED_MODELS if m.type in ("chairman", "both"))
+COUNCIL_MODELS_ALL = tuple(m for m in CURATED_MODELS if m.type in ("council", "both"))
+MODELS_BY_TYPE = {
+    "chairman": CHAIRMAN_MODELS,
+    "council": COUNCIL_MODELS_ALL,
+    "both": CURATED_MODELS,
+}
+
+# Per-model (input, output) $/M token price pairs for cost hot paths
+MODEL_PRICES = {m.id: (m.input_price, m.output_price) for m in CURATED_MODELS}
+
 # Legacy alias for backwards compatibility
 AVAILABLE_MODELS = CURATED_MODELS
 
@@ -148,6 +249,28 @@ RAG_SETTINGS = {
     }
 }
 
+
+class RagPreset(IntEnum):
+    """Preset ordinals indexing _PRESET_TABLE."""
+    AUTO = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    MAX = 4
+
+
+# Presets pre-resolved into a tuple indexed by RagPreset ordinal, so the
+# per-query lookup is one small-dict probe plus an array read instead of
+# hashing through the nested RAG_SETTINGS structure
+_PRESET_ORDER = ("auto", "low", "medium", "high", "max")
+_PRESET_TABLE = tuple(RAG_SETTINGS["presets"][k] for k in _PRESET_ORDER)
+_PRESET_INDEX = {k: i for i, k in enumerate(_PRESET_ORDER)}
+
+
+def get_preset(name: str) -> dict:
+    """Resolve a RAG preset by name; unknown names fall back to auto."""
+    return _PRESET_TABLE[_PRESET_INDEX.get(name, RagPreset.AUTO)]
+
 # =============================================================================
 # SESSION BUDGET CONFIGURATION
 # =============================================================================
@@ -175,9 +298,70 @@ BUDGET_POLICY = {
     }
 }
 
+# Sorted cutoffs so bucket resolution is one bisect call instead of a
+# linear scan that leans on dict insertion order
+_BUDGET_CUTOFFS = sorted(BUDGET_POLICY["thresholds"])
+_BUDGET_BUCKETS = [BUDGET_POLICY["thresholds"][k] for k in _BUDGET_CUTOFFS]
+
+
+def resolve_budget_policy(spent_pct: float) -> dict:
+    """Return the budget policy bucket for a spent percentage (0-100 scale).
+
+    Past the last cutoff, returns BUDGET_POLICY["post_100_behavior"].
+    """
+    i = bisect.bisect_left(_BUDGET_CUTOFFS, spent_pct)
+    if i >= len(_BUDGET_BUCKETS):
+        return BUDGET_POLICY["post_100_behavior"]
+    return _BUDGET_BUCKETS[i]
+
 # Task awareness heuristics (keywords for routing)
 TASK_SIGNALS = {
     "research_keywords": ["cite", "paper", "compare", "analyze", "research", "study"],
     "quick_keywords": ["quick", "briefly", "short", "summary", "tldr"],
     "research_query_length": 200,  # chars
 }
+
+# Precompiled keyword matchers for the routing hot path: one C-level regex
+# scan of the query instead of a Python loop of substring checks. Plain
+# alternation (no word boundaries) keeps the original substring semantics.
+TASK_SIGNALS["research_re"] = re.compile(
+    "|".join(map(re.escape, TASK_SIGNALS["research_keywords"])), re.IGNORECASE
+)
+TASK_SIGNALS["quick_re"] = re.compile(
+    "|".join(map(re.escape, TASK_SIGNALS["quick_keywords"])), re.IGNORECASE
+)
+
+# Frozen keyword sets for token-level membership checks
+TASK_SIGNALS["research_set"] = frozenset(TASK_SIGNALS["research_keywords"])
+TASK_SIGNALS["quick_set"] = frozenset(TASK_SIGNALS["quick_keywords"])
+
+
+# =============================================================================
+# FROZEN VIEWS
+# =============================================================================
+# These tables are process-wide constants; read-only proxies make that
+# explicit, so callers can stop taking defensive copies before sharing
+COUNCIL_MODELS = tuple(COUNCIL_MODELS)
+REASONING_MODELS = MappingProxyType(
+    {k: MappingProxyType(v) for k, v in REASONING_MODELS.items()}
+)
+RAG_SETTINGS = MappingProxyType({
+    **RAG_SETTINGS,
+    "presets": MappingProxyType(
+        {k: MappingProxyType(v) for k, v in RAG_SETTINGS["presets"].items()}
+    ),
+})
+BUDGET_POLICY = MappingProxyType({
+    **BUDGET_POLICY,
+    "thresholds": MappingProxyType(
+        {k: MappingProxyType(v) for k, v in BUDGET_POLICY["thresholds"].items()}
+    ),
+})
+SESSION_POLICY_DEFAULTS = MappingProxyType(SESSION_POLICY_DEFAULTS)
+TASK_SIGNALS = MappingProxyType(TASK_SIGNALS)
+
+# Re-point the pre-resolved tables at the frozen views so identity stays
+# consistent for callers mixing get_preset()/resolve_budget_policy() with
+# direct dict access
+_PRESET_TABLE = tuple(RAG_SETTINGS["presets"][k] for k in _PRESET_ORDER)
+_BUDGET_BUCKETS = [BUDGET_POLICY["thresholds"][k] for k in _BUDGET_CUTOFFS]
@@ -1,9 +1,21 @@
 """Cost Predictor: Estimates marginal cost before execution."""
 
-from typing import Dict, Any, Optional
+from __future__ import annotations
+
+import logging
+import math
+import sys
+from functools import cache, lru_cache
 from .config import CURATED_MODELS, RAG_SETTINGS
 from .logger import logger
 
+# NumPy ships transitively with the RAG stack; used only for the
+# vectorized large-council path, so its absence is fine
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # Token estimates by execution mode
 MODE_TOKEN_ESTIMATES = {
@@ -30,12 +42,60 @@ MODE_TOKEN_ESTIMATES = {
 }
 
 
-def get_model_pricing(model_id: str) -> Dict[str, float]:
-    """Get pricing for a model from config."""
-    for model in CURATED_MODELS:
-        if model["id"] == model_id:
-            return model.get("pricing", {"input": 1.0, "output": 5.0})
-    return {"input": 1.0, "output": 5.0}  # Conservative default
+_DEFAULT_PRICING = (1.0, 5.0)  # Conservative (input, output) default
+_DEFAULT_UNIT = (_DEFAULT_PRICING[0] / 1_000_000, _DEFAULT_PRICING[1] / 1_000_000)
+
+
+# Derived lookup tables are built lazily on first use rather than at
+# import, so code paths that never estimate costs (health checks, cold
+# starts) skip the allocations entirely; functools.cache makes each
+# builder a one-time cost
+
+@cache
+def _pricing_index() -> dict[str, tuple[float, float]]:
+    """Model id -> (input, output) $/M token pricing; replaces the old
+    linear scan over CURATED_MODELS per call."""
+    return {m.id: (m.input_price, m.output_price) for m in CURATED_MODELS}
+
+
+@cache
+def _unit_cost_index() -> dict[str, tuple]:
+    """Per-token unit costs pre-divided by 1M, so the council loop is two
+    multiplies per model instead of dict lookups plus divisions."""
+    return {
+        mid: (pi / 1_000_000, po / 1_000_000)
+        for mid, (pi, po) in _pricing_index().items()
+    }
+
+
+@cache
+def _mode_table() -> dict[str, tuple[int, int]]:
+    """Mode -> (base_input, base_output); interned keys so the hot-path
+    dict hit takes the pointer-equality fast path."""
+    return {
+        sys.intern(m): (v["base_input"], v["base_output"])
+        for m, v in MODE_TOKEN_ESTIMATES.items()
+    }
+
+
+# Vectorized unit-cost table; the last row is the default for unknown
+# models. Only pays off once a council is large enough to amortize the
+# array construction, so the scalar loop stays the small-council path.
+_VECTOR_MIN_COUNCIL = 16
+
+
+@cache
+def _vector_tables() -> tuple:
+    """(unit-cost array, model index, default row index) for the NumPy path."""
+    unit_cost = _unit_cost_index()
+    arr = np.array([*unit_cost.values(), _DEFAULT_UNIT], dtype=np.float64)
+    index = {mid: i for i, mid in enumerate(unit_cost)}
+    return arr, index, len(index)
+
+
+def get_model_pricing(model_id: str) -> tuple[float, float]:
+    """Get (input, output) $/M token pricing for a model from config."""
+    return _pricing_index().get(model_id, _DEFAULT_PRICING)
 
 
 def estimate_chat_cost(
@@ -54,19 +114,21 @@ def estimate_chat_cost(
     Returns:
         Estimated USD cost
     """
-    estimates = MODE_TOKEN_ESTIMATES.get(mode, MODE_TOKEN_ESTIMATES["standard"])
-    
-    total_input = estimates["base_input"] + rag_tokens
-    total_output = estimates["base_output"]
-    
-    pricing = get_model_pricing(chairman_model)
-    
-    cost = (
-        (total_input / 1_000_000) * pricing["input"] +
-        (total_output / 1_000_000) * pricing["output"]
-    )
-    
-    return round(cost, 6)
+    # Modes arrive from JSON payloads; interning makes the table hit a
+    # pointer comparison
+    return _estimate_chat_cost_cached(rag_tokens, chairman_model, sys.intern(mode))
+
+
+# The same (rag_tokens, chairman_model, mode) triple recurs within a turn
+# (UI re-renders, budget checks), so the estimators memoize on their
+# hashable args; .cache_clear() is exposed for tests
+@lru_cache(maxsize=512)
+def _estimate_chat_cost_cached(rag_tokens: int, chairman_model: str, mode: str) -> float:
+    mode_table = _mode_table()
+    base_input, base_output = mode_table.get(mode) or mode_table["standard"]
+
+    pi, po = _unit_cost_index().get(chairman_model, _DEFAULT_UNIT)
+    return (base_input + rag_tokens) * pi + base_output * po
 
 
 def estimate_council_cost(
@@ -85,39 +147,85 @@ def estimate_council_cost(
     Returns:
         Estimated USD cost
     """
-    estimates = MODE_TOKEN_ESTIMATES["council"]
-    total_cost = 0.0
-    
-    # Stage 1: Each council member responds
-    for model_id in council_models:
-        pricing = get_model_pricing(model_id)
-        stage1_cost = (
-            (estimates["base_input"] / 1_000_000) * pricing["input"] +
-            (estimates["base_output"] / 1_000_000) * pricing["output"]
-        )
-        total_cost += stage1_cost
-    
-    # Stage 2: Each council member ranks (longer input with all responses)
-    stage2_input = estimates["base_input"] + (estimates["base_output"] * len(council_models))
-    for model_id in council_models:
-        pricing = get_model_pricing(model_id)
-        stage2_cost = (
-            (stage2_input / 1_000_000) * pricing["input"] +
-            (estimates["base_output"] / 1_000_000) * pricing["output"]
-        )
-        total_cost += stage2_cost
-    
-    # Stage 3: Chairman synthesizes
+    # rag_tokens does not enter the council estimate, so the cache key
+    # is just the (frozen) council plus the chairman
+    return _estimate_council_cost_cached(tuple(council_models), chairman_model)
+
+
+@lru_cache(maxsize=256)
+def _estimate_council_cost_cached(
+    council_models: tuple[str, ...],
+    chairman_model: str,
+) -> float:
+    base_input, base_output = _mode_table()["council"]
+    unit_cost = _unit_cost_index()
+
+    if np is not None and len(council_models) >= _VECTOR_MIN_COUNCIL:
+        return _estimate_council_cost_vectorized(council_models, chairman_model, base_input, base_output)
+
+    # Stages 1 and 2 fused: each member responds (base_input) and ranks
+    # (stage2_input, which includes every response), so one pass over the
+    # council accumulates both contributions per model. Stage constants
+    # are hoisted out of the loop.
+    stage2_input = base_input + (base_output * len(council_models))
+    stage12_input = base_input + stage2_input
+    stage12_output = base_output * 2
     stage3_input = stage2_input * 2  # All responses + all rankings
-    pricing = get_model_pricing(chairman_model)
-    stage3_cost = (
-        (stage3_input / 1_000_000) * pricing["input"] +
-        (estimates["base_output"] * 2 / 1_000_000) * pricing["output"]
+    stage3_output = base_output * 2
+
+    # Per-model contributions summed with math.fsum for error-free float
+    # accumulation; the last slot is the chairman synthesis (stage 3)
+    contribs = [0.0] * (len(council_models) + 1)
+    for i, model_id in enumerate(council_models):
+        pi, po = unit_cost.get(model_id, _DEFAULT_UNIT)
+        contribs[i] = stage12_input * pi + stage12_output * po
+    pi, po = unit_cost.get(chairman_model, _DEFAULT_UNIT)
+    contribs[-1] = stage3_input * pi + stage3_output * po
+    total_cost = math.fsum(contribs)
+
+    # Level guard keeps the formatting/dispatch off the per-turn path
+    # when INFO is filtered
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[COST] Estimated council cost: $%.4f", total_cost)
+    return total_cost
+
+
+def _estimate_council_cost_vectorized(
+    council_models: tuple[str, ...],
+    chairman_model: str,
+    base_input: int,
+    base_output: int,
+) -> float:
+    """Large-council estimate as two dot products over the unit-cost table."""
+    unit_cost_arr, model_index, default_index = _vector_tables()
+    idx = np.fromiter(
+        (model_index.get(m, default_index) for m in council_models),
+        dtype=np.intp,
+        count=len(council_models),
     )
-    total_cost += stage3_cost
-    
-    logger.info("[COST] Estimated council cost: $%.4f", total_cost)
-    return round(total_cost, 6)
+    uc = unit_cost_arr[idx]
+
+    stage2_input = base_input + base_output * len(council_models)
+    # Stage 1 + Stage 2 token counts per member, folded into one vector
+    tokens = np.array([base_input + stage2_input, 2 * base_output], dtype=np.float64)
+    total_cost = float((uc @ tokens).sum())
+
+    # Stage 3: Chairman synthesizes
+    pi, po = _unit_cost_index().get(chairman_model, _DEFAULT_UNIT)
+    total_cost += (stage2_input * 2) * pi + (base_output * 2) * po
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[COST] Estimated council cost: $%.4f", total_cost)
+    return total_cost
+
+
+def format_usd(cost: float) -> str:
+    """Format a cost for display; rounding lives here, not in estimators.
+
+    Estimators return raw floats so sums against session budgets keep
+    full precision.
+    """
+    return f"${cost:.6f}"
 
 
 def estimate_turn_cost(
@@ -141,6 +249,11 @@ def estimate_turn_cost(
         Estimated USD cost
     """
     if is_council_mode and council_models:
-        return estimate_council_cost(council_models, chairman_model, rag_tokens)
-    else:
-        return estimate_chat_cost(rag_tokens, chairman_model, mode)
+        return _estimate_council_cost_cached(tuple(council_models), chairman_model)
+
+    # Dominant chat path inlined: two table hits and three multiplies,
+    # no extra call frame
+    mode_table = _mode_table()
+    base_input, base_output = mode_table.get(mode) or mode_table["standard"]
+    pi, po = _unit_cost_index().get(chairman_model, _DEFAULT_UNIT)
+    return (base_input + rag_tokens) * pi + base_output * po
@@ -1,15 +1,191 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Tuple
-from .openrouter import query_models_parallel, query_model
+from typing import AsyncIterator, List, Dict, Any, Tuple
+from .openrouter import query_models_parallel, query_model, query_model_stream
+from . import config
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
+from .cache import cache_enabled, get_cached_response, messages_fingerprint, store_response
 from .logger import logger
-from .tools.types import EvidencePack, UsageLimits
+from .tools.types import EvidencePack, UsageLimits, ToolCall
 from .tools.registry import ToolRegistry
 from .tools.router import ToolRouter
 from .tools.parser import ToolParser
+import asyncio
+import re
+import time
 import uuid
-import json
+from collections import Counter
+from operator import itemgetter
+
+# NumPy ships with the RAG stack; it only accelerates the ranking
+# statistics, so its absence just means the pure-Python fallback runs
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Ranking labels, with optional "1. " numbering, compiled once at import
+_RANKING_RE = re.compile(r"(?:\d+\.\s*)?(Response [A-Z])")
+
+# Prompt skeletons are module-level constants formatted per call, so the
+# static bulk of each prompt is allocated once at import and assembly is
+# a single .format() pass instead of rebuilding the full literal
+_EVIDENCE_INSTRUCTIONS = (
+    "\nINSTRUCTIONS FOR EVIDENCE:",
+    "1. Uses facts from the evidence above to answer the user's question.",
+    "2. When you use a fact, cite it using the [sID] format at the end of the sentence. Example: 'Apple stock is up [s1].'",
+    "3. If the evidence is insufficient, state what is unknown. Do NOT hallucinations.",
+)
+
+# Judge-facing variant used when evidence arrives after the drafts were
+# written and is injected into the ranking round instead
+_EVIDENCE_RANKING_INSTRUCTIONS = (
+    "\nINSTRUCTIONS FOR EVIDENCE:",
+    "1. Use the facts above to verify factual claims made by the responses.",
+    "2. Prefer responses that are consistent with the evidence; penalize responses that contradict it.",
+)
+
+_STAGE2_PROMPT = """You are evaluating different responses to the following question:
+
+Question: {user_query}
+
+Here are the responses from different models (anonymized):
+
+{responses_text}
+{evidence_context}
+Your task:
+1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
+2. Then, at the very end of your response, provide a final ranking.
+
+IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
+- Start with the line "FINAL RANKING:" (all caps, with colon)
+- Then list the responses from best to worst as a numbered list
+- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
+- Do not add any other text or explanations in the ranking section
+
+Example of the correct format for your ENTIRE response:
+
+Response A provides good detail on X but misses Y...
+Response B is accurate but lacks depth on Z...
+Response C offers the most comprehensive answer...
+
+FINAL RANKING:
+1. Response C
+2. Response A
+3. Response B
+
+Now provide your evaluation and ranking:"""
+
+_STAGE3_PROMPT = """You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
+
+Original Question: {user_query}
+
+STAGE 1 - Individual Responses:
+{stage1_text}
+
+STAGE 2 - Peer Rankings:
+{stage2_text}
+
+Consensus summary:
+Overall council confidence: {confidence_label}
+{consensus_details}
+
+Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
+- The individual responses and their insights
+- The peer rankings and what they reveal about response quality
+- Any patterns of agreement or disagreement
+
+Guidelines:
+- If confidence is HIGH, you can present a unified answer.
+- If confidence is MEDIUM or LOW, clearly mention that the council had mixed views and explain the main perspectives.
+- Stick to what the answers actually said - do not invent new facts.
+
+Note: The system will display "Confidence: {confidence_label}" in the UI automatically.
+You may mention the confidence level in your answer, but it's not required.
+
+Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
+
+_STEWARD_PROMPT = """You are the Tool Steward for an AI Council.
+Your job is to decide if tools are needed to answer the user's question, and if so, which ones.
+
+User Question: {user_query}
+
+{tool_descriptions}
+
+INSTRUCTIONS:
+1. Analyze the detailed question.
+2. Select the most relevant tools from the list above.
+3. Return a JSON object with your decision.
+
+FORMAT (JSON ONLY):
+{{
+  "action": "use_tools" | "no_tools",
+  "reason": "Why you made this decision",
+  "calls": [
+    {{
+      "name": "tool.name",
+      "arguments": {{ "arg": "value" }},
+      "purpose": "Why this specific call is needed",
+      "priority": "high" | "normal" | "low"
+    }}
+  ]
+}}
+
+If no tools are needed (e.g., for general chit-chat or pure logic questions), return action="no_tools".
+"""
+
+
+async def _query_models_cached(
+    models: List[str],
+    messages: List[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Query models in parallel, serving exact-repeat prompts from cache.
+
+    With COUNCIL_CACHE=1, models whose (model, prompt) pair was answered
+    recently skip the network entirely; only the misses are scheduled.
+    """
+    if not cache_enabled():
+        return await query_models_parallel(models, messages)
+
+    prompt = messages_fingerprint(messages)
+    hits: Dict[str, Any] = {}
+    misses: List[str] = []
+    for model in models:
+        cached = get_cached_response(model, prompt)
+        if cached is not None:
+            hits[model] = cached
+        else:
+            misses.append(model)
+
+    if hits:
+        logger.info("[CACHE] Prompt cache hits: %d/%d models", len(hits), len(models))
+
+    responses = await query_models_parallel(misses, messages) if misses else {}
+    for model, response in responses.items():
+        if response is not None:
+            store_response(model, prompt, response)
+
+    responses.update(hits)
+    return responses
+
+
+def _format_evidence_context(
+    evidence_pack: EvidencePack,
+    instructions: Tuple[str, ...] = _EVIDENCE_INSTRUCTIONS,
+) -> str:
+    """Render the steward's evidence as a compact prompt block with [sID]
+    citations, or an empty string when there is no evidence.
+
+    The instruction-independent body is rendered (and cached) by
+    EvidencePack.render(), so the tool/fact lines are serialized once per
+    run no matter how many stages or models consume the pack; only the
+    stage-specific instruction lines are appended here.
+    """
+    if not (evidence_pack and evidence_pack.tools_used):
+        return ""
+
+    return evidence_pack.render() + "\n" + "\n".join(instructions)
 
 
 async def stage1_collect_responses(user_query: str, models: List[str] = None, evidence_pack: EvidencePack = None) -> List[Dict[str, Any]]:
@@ -25,32 +201,9 @@ async def stage1_collect_responses(user_query: str, models: List[str] = None, ev
         List of dicts with 'model' and 'response' keys
     """
     target_models = models or COUNCIL_MODELS
-    
+
     # Format evidence for the prompt if available
-    evidence_context = ""
-    if evidence_pack and evidence_pack.tools_used:
-        # Render a compact summary with [sID] citations
-        summary_lines = ["\nEVIDENCE FROM TOOL STEWARD:"]
-        
-        # 1. Tool Outputs
-        for tool_run in evidence_pack.tools_used:
-             if tool_run.status == "executed":
-                 summary_lines.append(f"- {tool_run.tool_name}: {tool_run.output_summary}")
-             else:
-                 summary_lines.append(f"- {tool_run.tool_name} (Rejected): {tool_run.output_summary}")
-        
-        # 2. Key Facts with IDs
-        if evidence_pack.key_facts:
-            summary_lines.append("\nKEY FACTS:")
-            for fact in evidence_pack.key_facts:
-                summary_lines.append(f"- {fact.fact} [s{fact.source_id}] (Confidence: {fact.confidence_score})")
-        
-        summary_lines.append("\nINSTRUCTIONS FOR EVIDENCE:")
-        summary_lines.append("1. Uses facts from the evidence above to answer the user's question.")
-        summary_lines.append("2. When you use a fact, cite it using the [sID] format at the end of the sentence. Example: 'Apple stock is up [s1].'")
-        summary_lines.append("3. If the evidence is insufficient, state what is unknown. Do NOT hallucinations.")
-        
-        evidence_context = "\n".join(summary_lines)
+    evidence_context = _format_evidence_context(evidence_pack)
 
     prompt = f"""{user_query}
 
@@ -59,7 +212,7 @@ async def stage1_collect_responses(user_query: str, models: List[str] = None, ev
     messages = [{"role": "user", "content": prompt}]
 
     # Query all models in parallel
-    responses = await query_models_parallel(target_models, messages)
+    responses = await _query_models_cached(target_models, messages)
 
     # Format results
     stage1_results = []
@@ -74,11 +227,71 @@ async def stage1_collect_responses(user_query: str, models: List[str] = None, ev
     return stage1_results
 
 
+async def stage1_collect_responses_iter(
+    user_query: str,
+    models: List[str] = None,
+    evidence_pack: EvidencePack = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stage 1 variant that yields each model's result as it finishes.
+
+    Same fan-out, prompt, and caching as stage1_collect_responses, but
+    results surface in completion order via asyncio.as_completed so the
+    streaming endpoint can forward each council member's answer without
+    waiting for the slowest model. Failed models are skipped, matching
+    the batch variant.
+
+    Yields:
+        Dicts with 'model', 'response' and 'usage' keys
+    """
+    target_models = list(dict.fromkeys(models or COUNCIL_MODELS))
+
+    evidence_context = _format_evidence_context(evidence_pack)
+
+    prompt = f"""{user_query}
+
+{evidence_context}"""
+
+    messages = [{"role": "user", "content": prompt}]
+
+    use_cache = cache_enabled()
+    fingerprint = messages_fingerprint(messages) if use_cache else None
+
+    # Serve cache hits immediately; only misses go to the network
+    misses: List[str] = []
+    for model in target_models:
+        cached = get_cached_response(model, fingerprint) if use_cache else None
+        if cached is not None:
+            yield {
+                "model": model,
+                "response": cached.get('content', ''),
+                "usage": cached.get('usage', {})
+            }
+        else:
+            misses.append(model)
+
+    async def _query_one(model: str) -> Tuple[str, Any]:
+        return model, await query_model(model, messages)
+
+    for task in asyncio.as_completed([_query_one(m) for m in misses]):
+        model, response = await task
+        if response is None:  # Only include successful responses
+            continue
+        if use_cache:
+            store_response(model, fingerprint, response)
+        yield {
+            "model": model,
+            "response": response.get('content', ''),
+            "usage": response.get('usage', {})
+        }
+
+
 async def stage2_collect_rankings(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    models: List[str] = None
-) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    models: List[str] = None,
+    evidence_pack: EvidencePack = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, str], List[str]]:
     """
     Stage 2: Each model ranks the anonymized responses.
 
@@ -86,12 +299,24 @@ async def stage2_collect_rankings(
         user_query: The original user query
         stage1_results: Results from Stage 1
         models: Optional list of models to query (defaults to COUNCIL_MODELS)
+        evidence_pack: Optional evidence gathered by the Steward; shown to
+            the judges so they can verify factual claims while ranking
 
     Returns:
-        Tuple of (rankings list, label_to_model mapping)
+        Tuple of (rankings list, label_to_model mapping, labeled response
+        blocks) — the labeled blocks are reused verbatim by Stage 3 so the
+        anonymized text is only built once per turn
     """
     target_models = models or COUNCIL_MODELS
-    
+
+    # With zero or one drafts there is nothing to rank; skip the judge
+    # fan-out entirely rather than paying N LLM calls on the degenerate path
+    if len(stage1_results) <= 1:
+        if not stage1_results:
+            return [], {}, []
+        only = stage1_results[0]
+        return [], {"Response A": only['model']}, [f"Response A:\n{only['response']}"]
+
     # Create anonymized labels for responses (Response A, Response B, etc.)
     labels = [chr(65 + i) for i in range(len(stage1_results))]  # A, B, C, ...
 
@@ -101,47 +326,25 @@ async def stage2_collect_rankings(
         for label, result in zip(labels, stage1_results)
     }
 
-    # Build the ranking prompt
-    responses_text = "\n\n".join([
+    # Build the anonymized response blocks once; Stage 3 reuses them
+    labeled_responses = [
         f"Response {label}:\n{result['response']}"
         for label, result in zip(labels, stage1_results)
-    ])
-
-    ranking_prompt = f"""You are evaluating different responses to the following question:
-
-Question: {user_query}
-
-Here are the responses from different models (anonymized):
-
-{responses_text}
-
-Your task:
-1. First, evaluate each response individually. For each response, explain what it does well and what it does poorly.
-2. Then, at the very end of your response, provide a final ranking.
-
-IMPORTANT: Your final ranking MUST be formatted EXACTLY as follows:
-- Start with the line "FINAL RANKING:" (all caps, with colon)
-- Then list the responses from best to worst as a numbered list
-- Each line should be: number, period, space, then ONLY the response label (e.g., "1. Response A")
-- Do not add any other text or explanations in the ranking section
-
-Example of the correct format for your ENTIRE response:
-
-Response A provides good detail on X but misses Y...
-Response B is accurate but lacks depth on Z...
-Response C offers the most comprehensive answer...
-
-FINAL RANKING:
-1. Response C
-2. Response A
-3. Response B
-
-Now provide your evaluation and ranking:"""
+    ]
+    responses_text = "\n\n".join(labeled_responses)
+
+    ranking_prompt = _STAGE2_PROMPT.format(
+        user_query=user_query,
+        responses_text=responses_text,
+        evidence_context=_format_evidence_context(
+            evidence_pack, _EVIDENCE_RANKING_INSTRUCTIONS
+        ),
+    )
 
     messages = [{"role": "user", "content": ranking_prompt}]
 
     # Get rankings from all council models in parallel
-    responses = await query_models_parallel(target_models, messages)
+    responses = await _query_models_cached(target_models, messages)
 
     # Format results
     stage2_results = []
@@ -156,81 +359,144 @@ Now provide your evaluation and ranking:"""
                 "usage": response.get('usage', {})
             })
 
-    return stage2_results, label_to_model
+    return stage2_results, label_to_model, labeled_responses
 
 
-async def stage3_synthesize_final(
+async def stage12_combined(
+    user_query: str,
+    models: List[str] = None,
+    evidence_pack: EvidencePack = None,
+    steward_task: "asyncio.Task" = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, str], List[str]]:
+    """
+    Run stages 1 and 2 as one pipelined step.
+
+    The ranking round already batches per-judge evaluation, self-critique,
+    and the final ranking into a single message, so each judge costs one
+    call per stage rather than one call per peer. A full single-call
+    fusion is not possible — a judge cannot rank drafts that do not exist
+    yet — but combining the stages here keeps the dependency handoff
+    (drafts -> ranking prompt) in one place with no intermediate caller
+    round-trip.
+
+    When steward_task (an in-flight run_tool_steward_phase task) is given,
+    Stage 1 drafts while the steward gathers evidence; whatever evidence
+    it produced is then injected into the Stage 2 ranking prompt so the
+    judges can verify factual claims against it. Pass evidence_pack
+    directly instead to render the evidence into the Stage 1 drafts.
+
+    Returns:
+        Tuple of (stage1_results, stage2_results, label_to_model,
+        labeled_responses)
+    """
+    stage1_results = await stage1_collect_responses(user_query, models, evidence_pack)
+
+    if steward_task is not None:
+        # Stage 1 typically dominates, so by now the steward is done (or
+        # nearly so) and this wait costs little
+        evidence_pack, _ = await steward_task
+
+    if not stage1_results:
+        return [], [], {}, []
+
+    stage2_results, label_to_model, labeled_responses = await stage2_collect_rankings(
+        user_query, stage1_results, models,
+        evidence_pack=None if steward_task is None else evidence_pack,
+    )
+    return stage1_results, stage2_results, label_to_model, labeled_responses
+
+
+def _build_chairman_prompt(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
     stage2_results: List[Dict[str, Any]],
-    label_to_model: Dict[str, str],
     quality_metrics: Dict[str, Dict[str, Any]],
-    chairman_model: str = None
-) -> Dict[str, Any]:
-    """
-    Stage 3: Chairman synthesizes final answer with confidence scoring.
-    
-    Args:
-        user_query: Original user question
-        stage1_results: Individual model responses
-        stage2_results: Model rankings
-        label_to_model: Mapping from anonymous labels to model names
-        quality_metrics: Per-model quality metrics from Stage 2 rankings
-        chairman_model: Optional chairman model ID
-        
-    Returns:
-        Dict with 'response', 'model', 'usage', 'confidence', 'avg_consensus', 'quality_metrics'
+    labeled_responses: List[str] = None,
+) -> Tuple[str, str, float]:
+    """Assemble the Stage 3 chairman prompt and its confidence inputs.
+
+    Returns (chairman_prompt, confidence_label, avg_consensus); shared by
+    the buffered and streaming synthesis variants.
     """
-    target_chairman = chairman_model or CHAIRMAN_MODEL
-    
     # Compute overall confidence
     confidence_label, avg_consensus = compute_overall_confidence(quality_metrics)
     consensus_details = format_consensus_details(quality_metrics)
-    
+
     # Build comprehensive context for chairman
     # Use anonymous labels to match the rankings
-    stage1_text_parts = []
-    for i, result in enumerate(stage1_results):
-        label = chr(65 + i)  # A, B, C...
-        stage1_text_parts.append(f"Response {label}:\n{result['response']}")
-    stage1_text = "\n\n".join(stage1_text_parts)
+    if labeled_responses is None:
+        labeled_responses = [
+            f"Response {chr(65 + i)}:\n{result['response']}"
+            for i, result in enumerate(stage1_results)
+        ]
+    stage1_text = "\n\n".join(labeled_responses)
 
     stage2_text = "\n\n".join([
         f"Model: {result['model']}\nRanking: {result['ranking']}"
         for result in stage2_results
     ])
 
-    chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models have provided responses to a user's question, and then ranked each other's responses.
-
-Original Question: {user_query}
-
-STAGE 1 - Individual Responses:
-{stage1_text}
+    chairman_prompt = _STAGE3_PROMPT.format(
+        user_query=user_query,
+        stage1_text=stage1_text,
+        stage2_text=stage2_text,
+        confidence_label=confidence_label,
+        consensus_details=consensus_details,
+    )
+    return chairman_prompt, confidence_label, avg_consensus
 
-STAGE 2 - Peer Rankings:
-{stage2_text}
 
-Consensus summary:
-Overall council confidence: {confidence_label}
-{consensus_details}
-
-Your task as Chairman is to synthesize all of this information into a single, comprehensive, accurate answer to the user's original question. Consider:
-- The individual responses and their insights
-- The peer rankings and what they reveal about response quality
-- Any patterns of agreement or disagreement
+async def stage3_synthesize_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    quality_metrics: Dict[str, Dict[str, Any]],
+    chairman_model: str = None,
+    labeled_responses: List[str] = None
+) -> Dict[str, Any]:
+    """
+    Stage 3: Chairman synthesizes final answer with confidence scoring.
 
-Guidelines:
-- If confidence is HIGH, you can present a unified answer.
-- If confidence is MEDIUM or LOW, clearly mention that the council had mixed views and explain the main perspectives.
-- Stick to what the answers actually said - do not invent new facts.
+    Args:
+        user_query: Original user question
+        stage1_results: Individual model responses
+        stage2_results: Model rankings
+        label_to_model: Mapping from anonymous labels to model names
+        quality_metrics: Per-model quality metrics from Stage 2 rankings
+        chairman_model: Optional chairman model ID
+        labeled_responses: Anonymized response blocks already built by
+            Stage 2; rebuilt from stage1_results when not provided
 
-Note: The system will display "Confidence: {confidence_label}" in the UI automatically.
-You may mention the confidence level in your answer, but it's not required.
+    Returns:
+        Dict with 'response', 'model', 'usage', 'confidence', 'avg_consensus', 'quality_metrics'
+    """
+    target_chairman = chairman_model or CHAIRMAN_MODEL
 
-Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
+    chairman_prompt, confidence_label, avg_consensus = _build_chairman_prompt(
+        user_query, stage1_results, stage2_results, quality_metrics, labeled_responses
+    )
 
     messages = [{"role": "user", "content": chairman_prompt}]
 
+    # Re-running Stage 3 over the same drafts and rankings (e.g. when a
+    # user retries with a chairman already tried) reproduces the prompt
+    # byte-for-byte, so the synthesis is content-addressed in the same
+    # prompt cache the earlier stages use
+    prompt_key = messages_fingerprint(messages)
+    if cache_enabled():
+        cached = get_cached_response(target_chairman, prompt_key)
+        if cached is not None and cached.get("content"):
+            logger.info(f"[STAGE3] Synthesis served from prompt cache")
+            return {
+                "model": target_chairman,
+                "response": cached.get("content", ""),
+                "usage": cached.get("usage", {}),
+                "confidence": confidence_label,
+                "avg_consensus": avg_consensus,
+                "quality_metrics": quality_metrics,
+            }
+
     # Query the chairman model
     logger.info(f"[STAGE3] Requesting synthesis from {target_chairman}...")
     response = await query_model(target_chairman, messages)
@@ -247,6 +513,9 @@ Provide a clear, well-reasoned final answer that represents the council's collec
             "quality_metrics": quality_metrics,
         }
 
+    if cache_enabled():
+        store_response(target_chairman, prompt_key, response)
+
     logger.info(f"[STAGE3] Synthesis complete, confidence={confidence_label}")
 
     return {
@@ -259,6 +528,98 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     }
 
 
+async def stage3_synthesize_final_stream(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    label_to_model: Dict[str, str],
+    quality_metrics: Dict[str, Dict[str, Any]],
+    chairman_model: str = None,
+    labeled_responses: List[str] = None
+):
+    """
+    Streaming variant of stage3_synthesize_final.
+
+    Yields {"delta": str} chunks as the chairman generates, then a final
+    {"done": True, "data": ...} entry whose data matches what
+    stage3_synthesize_final returns. Time to the first visible token
+    drops from the full synthesis time to roughly one round-trip.
+    """
+    target_chairman = chairman_model or CHAIRMAN_MODEL
+
+    chairman_prompt, confidence_label, avg_consensus = _build_chairman_prompt(
+        user_query, stage1_results, stage2_results, quality_metrics, labeled_responses
+    )
+
+    messages = [{"role": "user", "content": chairman_prompt}]
+
+    # Same content-addressed reuse as the buffered variant; a hit is
+    # replayed as a single delta so streaming consumers need no special case
+    prompt_key = messages_fingerprint(messages)
+    if cache_enabled():
+        cached = get_cached_response(target_chairman, prompt_key)
+        if cached is not None and cached.get("content"):
+            logger.info(f"[STAGE3] Synthesis served from prompt cache")
+            yield {"delta": cached["content"]}
+            yield {
+                "done": True,
+                "data": {
+                    "model": target_chairman,
+                    "response": cached["content"],
+                    "usage": cached.get("usage", {}),
+                    "confidence": confidence_label,
+                    "avg_consensus": avg_consensus,
+                    "quality_metrics": quality_metrics,
+                },
+            }
+            return
+
+    logger.info(f"[STAGE3] Streaming synthesis from {target_chairman}...")
+    final: Dict[str, Any] = {}
+    async for chunk in query_model_stream(target_chairman, messages):
+        if chunk.get("done"):
+            final = chunk
+            break
+        yield chunk
+
+    content = final.get("content", "")
+    if not content:
+        logger.error(f"[STAGE3] ERROR: streaming synthesis returned no content")
+        # Fallback if chairman fails
+        yield {
+            "done": True,
+            "data": {
+                "model": target_chairman,
+                "response": "Error: Unable to generate final synthesis.",
+                "usage": {},
+                "confidence": "UNKNOWN",
+                "avg_consensus": 0.0,
+                "quality_metrics": quality_metrics,
+            },
+        }
+        return
+
+    if cache_enabled():
+        store_response(target_chairman, prompt_key, {
+            "content": content,
+            "usage": final.get("usage", {}),
+        })
+
+    logger.info(f"[STAGE3] Synthesis complete, confidence={confidence_label}")
+
+    yield {
+        "done": True,
+        "data": {
+            "model": target_chairman,
+            "response": content,
+            "usage": final.get("usage", {}),
+            "confidence": confidence_label,
+            "avg_consensus": avg_consensus,
+            "quality_metrics": quality_metrics,
+        },
+    }
+
+
 def parse_ranking_from_text(ranking_text: str) -> List[str]:
     """
     Parse the FINAL RANKING section from the model's response.
@@ -269,33 +630,120 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Safely extract Response labels
-                parsed = []
-                for m in numbered_matches:
-                    match = re.search(r'Response [A-Z]', m)
-                    if match:
-                        parsed.append(match.group())
-                return parsed
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
-
-    # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
+    # Scan everything after the last "FINAL RANKING:" (or the whole text
+    # if the marker is absent) in a single pass with the precompiled
+    # pattern; the optional numbering prefix means numbered and bare
+    # labels both resolve to the captured "Response X" group. rpartition
+    # also means a judge echoing the marker from the prompt's example
+    # cannot shadow its real ranking.
+    _head, sep, tail = ranking_text.rpartition("FINAL RANKING:")
+    section = tail if sep else ranking_text
+    # Dedup in order: a judge re-mentioning a label in prose after the
+    # numbered list must not give that model a second position
+    return list(dict.fromkeys(_RANKING_RE.findall(section)))
+
+
+# Local short-circuits for the auxiliary helpers ---------------------------
+# extract_topics, generate_conversation_title, and rewrite_query each cost
+# a flash-model round-trip (~0.5-1.5s) for tiny lexical tasks. The
+# heuristics below handle the common cases with zero network calls; the
+# LLM path stays as fallback when a heuristic is not confident.
+
+_STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because
+been before being below between both but by can could did do does doing
+down during each few for from further had has have having he her here hers
+him his how i if in into is it its itself just me more most my myself no
+nor not now of off on once only or other our ours out over own please same
+she should so some such than that the their theirs them then there these
+they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours
+""".split())
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9'-]*")
+_PRONOUN_RE = re.compile(r"\b(it|its|that|this|they|them|those)\b", re.IGNORECASE)
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][A-Za-z0-9'-]*(?:\s+[A-Z][A-Za-z0-9'-]*)*")
+
+# Capitalized words that are never useful antecedents for a pronoun swap
+_DATE_WORDS = frozenset("""
+monday tuesday wednesday thursday friday saturday sunday january february
+march april may june july august september october november december
+today tomorrow yesterday
+""".split())
+
+# List-marker prefixes stripped from LLM query rewrites
+_REWRITE_PREFIXES = ("> ", "* ", "- ", "• ", "**")
+
+
+def _extract_topics_local(text: str, max_topics: int) -> "List[str] | None":
+    """Frequency-based keyword extraction; None when not confident."""
+    counts = Counter(
+        word
+        for word in _WORD_RE.findall(text.lower())
+        if len(word) >= 3 and word not in _STOPWORDS
+    )
+    if len(counts) < max_topics:
+        return None
+    return [word for word, _count in counts.most_common(max_topics)]
+
+
+def _title_from_query(user_query: str) -> "str | None":
+    """Build a short title from the query's informative words; None when
+    the query is too sparse to title confidently."""
+    words = [w for w in _WORD_RE.findall(user_query) if w.lower() not in _STOPWORDS]
+    if len(words) < 2:
+        return None
+    title = " ".join(w if w[0].isupper() else w.capitalize() for w in words[:5])
+    if len(title) > 50:
+        title = title[:47] + "..."
+    return title
+
+
+def _is_acronym_of(short: str, full: str) -> bool:
+    """True if `short` is the initialism of `full` (e.g. RAG for
+    Retrieval-Augmented Generation)."""
+    initials = "".join(w[0] for w in re.split(r"[\s-]+", full) if w)
+    return short.upper() == initials.upper()
+
+
+def _resolve_pronouns_local(query: str, context: str) -> "str | None":
+    """Swap the query's first pronoun for the context's proper-noun
+    antecedent, but only when that antecedent is unambiguous; None (LLM
+    fallback) otherwise.
+
+    Sentence-initial capitals say nothing about nounhood, so those
+    tokens are ignored, as are weekday/month words. If the surviving
+    mentions name more than one entity, the swap is declined instead of
+    guessed — a wrong expansion here corrupts RAG retrieval downstream.
+    """
+    candidates = []
+    for m in _PROPER_NOUN_RE.finditer(context):
+        span = m.group(0)
+        first = span.split()[0].lower()
+        if first in _STOPWORDS or first in _DATE_WORDS:
+            continue
+        # Skip sentence-initial tokens: start of text/line, after a
+        # "role:" prefix, or after sentence-ending punctuation
+        prefix = context[:m.start()].rstrip()
+        if not prefix or prefix.endswith((".", "!", "?", ":", "\n")):
+            continue
+        candidates.append(span)
+    if not candidates:
+        return None
+
+    # All mentions must resolve to one entity: exact repeats, substrings
+    # of the longest form, or its acronym
+    distinct = list(dict.fromkeys(candidates))
+    antecedent = max(distinct, key=len)
+    for candidate in distinct:
+        if candidate in antecedent or _is_acronym_of(candidate, antecedent):
+            continue
+        return None
+
+    def _swap(match: "re.Match[str]") -> str:
+        return f"{antecedent}'s" if match.group(0).lower() == "its" else antecedent
+
+    return _PRONOUN_RE.sub(_swap, query, count=1)
 
 
 async def extract_topics(text: str, max_topics: int = 3) -> List[str]:
@@ -313,6 +761,12 @@ async def extract_topics(text: str, max_topics: int = 3) -> List[str]:
     if not text:
         return []
 
+    # Local keyword extraction handles most texts without a network call
+    local_topics = _extract_topics_local(text[:800], max_topics)
+    if local_topics is not None:
+        logger.info("[PHASE1] Topics extracted locally: %s", local_topics)
+        return local_topics
+
     prompt = f"""Extract {max_topics} main topics or keywords from the text below.
 Return only a comma separated list, no explanations.
 Each topic should be 1 to 3 words.
@@ -343,50 +797,98 @@ Topics:"""
     return topics
 
 
+def _rank_statistics(
+    parsed_rankings: List[List[str]],
+    label_to_model: Dict[str, str],
+) -> List[Tuple[str, float, float, int]]:
+    """
+    Per-model rank statistics from the judges' parsed rankings.
+
+    Builds one (model x judge) position matrix shared by both the quality
+    metrics and the aggregate rankings, so each turn's rankings are walked
+    a single time. Missing entries are NaN so per-model stats only cover
+    judges that actually ranked that model.
+
+    Returns:
+        List of (model, avg_rank, variance, num_rankings) tuples for
+        models that received at least one ranking.
+    """
+    models = list(dict.fromkeys(label_to_model.values()))
+    if not models or not parsed_rankings:
+        return []
+
+    if np is None:
+        # Pure-Python fallback mirroring the matrix computation
+        stats = []
+        for model in models:
+            positions = [
+                position
+                for parsed in parsed_rankings
+                for position, label in enumerate(parsed, start=1)
+                if label_to_model.get(label) == model
+            ]
+            if positions:
+                avg_rank = sum(positions) / len(positions)
+                variance = sum((p - avg_rank) ** 2 for p in positions) / len(positions)
+                stats.append((model, avg_rank, variance, len(positions)))
+        return stats
+
+    model_index = {model: idx for idx, model in enumerate(models)}
+    positions = np.full((len(models), len(parsed_rankings)), np.nan, dtype=np.float32)
+    for judge_idx, parsed in enumerate(parsed_rankings):
+        for position, label in enumerate(parsed, start=1):
+            model = label_to_model.get(label)
+            if model is not None:
+                positions[model_index[model], judge_idx] = position
+
+    # nansum-based mean/variance avoids the empty-slice warnings that
+    # np.nanmean raises for models no judge ranked
+    counts = np.count_nonzero(~np.isnan(positions), axis=1)
+    ranked = counts > 0
+    avg_rank = np.full(len(models), np.nan, dtype=np.float32)
+    avg_rank[ranked] = np.nansum(positions, axis=1)[ranked] / counts[ranked]
+    variance = np.full(len(models), np.nan, dtype=np.float32)
+    variance[ranked] = (
+        np.nansum(positions * positions, axis=1)[ranked] / counts[ranked]
+        - avg_rank[ranked] ** 2
+    )
+
+    return [
+        (model, float(avg_rank[idx]), float(variance[idx]), int(counts[idx]))
+        for idx, model in enumerate(models)
+        if ranked[idx]
+    ]
+
+
 def calculate_quality_metrics(
     stage2_results: List[Dict[str, Any]],
     label_to_model: Dict[str, str],
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute avg_rank and consensus_score per model from Stage 2 rankings.
-    
+
     Args:
         stage2_results: Rankings from each model in Stage 2
         label_to_model: Mapping from anonymous labels to model names
-        
+
     Returns:
         Dict mapping model name to quality metrics:
         - avg_rank: lower is better (1 is best)
         - consensus_score: 0-1, higher means more agreement
         - num_rankings: number of times ranked
     """
-    from collections import defaultdict
-    
-    positions_by_model = defaultdict(list)
-
-    for ranking in stage2_results:
-        parsed = ranking.get("parsed_ranking") or []
-        for position, label in enumerate(parsed, start=1):
-            model = label_to_model.get(label)
-            if model:
-                positions_by_model[model].append(position)
-
-    quality_metrics: Dict[str, Dict[str, float]] = {}
+    parsed_rankings = [r.get("parsed_ranking") or [] for r in stage2_results]
 
-    for model, positions in positions_by_model.items():
-        if not positions:
-            continue
-
-        avg_rank = sum(positions) / len(positions)
-
-        variance = sum((p - avg_rank) ** 2 for p in positions) / len(positions)
-        consensus_score = 1.0 / (1.0 + variance)
-
-        quality_metrics[model] = {
+    quality_metrics: Dict[str, Dict[str, float]] = {
+        model: {
             "avg_rank": round(avg_rank, 2),
-            "consensus_score": round(consensus_score, 2),
-            "num_rankings": len(positions),
+            "consensus_score": round(1.0 / (1.0 + variance), 2),
+            "num_rankings": num_rankings,
         }
+        for model, avg_rank, variance, num_rankings in _rank_statistics(
+            parsed_rankings, label_to_model
+        )
+    }
 
     logger.info("[PHASE1] Quality metrics: %s", quality_metrics)
     return quality_metrics
@@ -437,17 +939,19 @@ def format_consensus_details(
     if not quality_metrics:
         return ""
 
-    lines = []
-    for model, metrics in sorted(
-        quality_metrics.items(),
-        key=lambda item: item[1].get("avg_rank", 999),
-    ):
-        lines.append(
-            f"- {model}: avg rank {metrics.get('avg_rank')}, "
-            f"consensus {metrics.get('consensus_score')}"
-        )
-
-    return "\n".join(lines)
+    # Pull the sort key out once per model instead of re-running the
+    # dict lookup lambda on every comparison
+    pairs = [
+        (metrics.get("avg_rank", 999), model, metrics)
+        for model, metrics in quality_metrics.items()
+    ]
+    pairs.sort(key=itemgetter(0))
+
+    return "\n".join(
+        f"- {model}: avg rank {metrics.get('avg_rank')}, "
+        f"consensus {metrics.get('consensus_score')}"
+        for _avg_rank, model, metrics in pairs
+    )
 
 
 def calculate_aggregate_rankings(
@@ -464,32 +968,23 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and average rank, sorted best to worst
     """
-    from collections import defaultdict
-
-    # Track positions for each model
-    model_positions = defaultdict(list)
-
-    for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
-
-        for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
-                model_positions[model_name].append(position)
-
-    # Calculate average position for each model
-    aggregate = []
-    for model, positions in model_positions.items():
-        if positions:
-            avg_rank = sum(positions) / len(positions)
-            aggregate.append({
-                "model": model,
-                "average_rank": round(avg_rank, 2),
-                "rankings_count": len(positions)
-            })
+    # Stage 2 already parsed each ranking; only re-parse if the field is
+    # missing (e.g. older stored sessions)
+    parsed_rankings = [
+        ranking.get('parsed_ranking') or parse_ranking_from_text(ranking['ranking'])
+        for ranking in stage2_results
+    ]
+
+    aggregate = [
+        {
+            "model": model,
+            "average_rank": round(avg_rank, 2),
+            "rankings_count": num_rankings,
+        }
+        for model, avg_rank, _variance, num_rankings in _rank_statistics(
+            parsed_rankings, label_to_model
+        )
+    ]
 
     # Sort by average rank (lower is better)
     aggregate.sort(key=lambda x: x['average_rank'])
@@ -507,6 +1002,13 @@ async def generate_conversation_title(user_query: str) -> str:
     Returns:
         A short title (3-5 words)
     """
+    # A heuristic title from the query's informative words avoids the
+    # flash-model round-trip on the first message of every conversation
+    local_title = _title_from_query(user_query)
+    if local_title is not None:
+        logger.info("[PHASE1] Title generated locally: %r", local_title)
+        return local_title
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -523,10 +1025,8 @@ Title:"""
         # Fallback to a generic title
         return "New Conversation"
 
-    title = response.get('content', 'New Conversation').strip()
-
-    # Clean up the title - remove quotes, limit length
-    title = title.strip('"\'')
+    # One strip pass removes whitespace and surrounding quotes together
+    title = (response.get('content') or 'New Conversation').strip(' \t\r\n"\'')
 
     # Truncate if too long
     if len(title) > 50:
@@ -546,34 +1046,9 @@ async def run_tool_steward_phase(user_query: str, run_id: str, chairman_model: s
     # 1. Dynamic Prompting
     tool_descriptions = ToolRegistry.to_prompt_format()
     
-    steward_prompt = f"""You are the Tool Steward for an AI Council.
-Your job is to decide if tools are needed to answer the user's question, and if so, which ones.
-
-User Question: {user_query}
-
-{tool_descriptions}
-
-INSTRUCTIONS:
-1. Analyze the detailed question.
-2. Select the most relevant tools from the list above.
-3. Return a JSON object with your decision.
-
-FORMAT (JSON ONLY):
-{{
-  "action": "use_tools" | "no_tools",
-  "reason": "Why you made this decision",
-  "calls": [
-    {{
-      "name": "tool.name",
-      "arguments": {{ "arg": "value" }},
-      "purpose": "Why this specific call is needed",
-      "priority": "high" | "normal" | "low"
-    }}
-  ]
-}}
-
-If no tools are needed (e.g., for general chit-chat or pure logic questions), return action="no_tools".
-"""
+    steward_prompt = _STEWARD_PROMPT.format(
+        user_query=user_query, tool_descriptions=tool_descriptions
+    )
 
     messages = [{"role": "user", "content": steward_prompt}]
     
@@ -596,8 +1071,7 @@ If no tools are needed (e.g., for general chit-chat or pure logic questions), re
 
     if parsed_data.get("action") == "use_tools" and parsed_data.get("calls"):
         logger.info(f"[STEWARD] Decided to use tools: {len(parsed_data['calls'])} calls")
-        from .tools.types import ToolCall
-        
+
         tool_calls = []
         for call_dict in parsed_data["calls"]:
             try:
@@ -647,11 +1121,18 @@ async def run_full_council(
     run_id = str(uuid.uuid4())
     logger.info(f"[COUNCIL] Starting run {run_id}")
 
-    # Stage 0: Tool Steward
-    evidence_pack, steward_usage = await run_tool_steward_phase(user_query, run_id, chairman_model)
+    # Stage 0 (steward) runs concurrently with the Stage 1 drafts: the
+    # steward's 1-3s of chairman latency is hidden behind the drafting
+    # fan-out, and its evidence is injected into the Stage 2 ranking
+    # round instead of the drafts
+    steward_task = asyncio.create_task(
+        run_tool_steward_phase(user_query, run_id, chairman_model)
+    )
 
-    # Stage 1: Collect individual responses (with evidence)
-    stage1_results = await stage1_collect_responses(user_query, council_models, evidence_pack)
+    stage1_results, stage2_results, label_to_model, labeled_responses = await stage12_combined(
+        user_query, council_models, steward_task=steward_task
+    )
+    evidence_pack, steward_usage = await steward_task
 
     # If no models responded successfully, return error
     if not stage1_results:
@@ -660,14 +1141,10 @@ async def run_full_council(
             "response": "All models failed to respond. Please try again."
         }, {}
 
-    # Stage 2: Collect rankings
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results, council_models)
-
-    # Calculate aggregate rankings
-    aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-    
-    # Calculate quality metrics for confidence scoring
-    quality_metrics = calculate_quality_metrics(stage2_results, label_to_model)
+    # Consensus math is meaningless without rankings (e.g. a single
+    # responding model); empty metrics yield confidence=UNKNOWN downstream
+    aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model) if stage2_results else []
+    quality_metrics = calculate_quality_metrics(stage2_results, label_to_model) if stage2_results else {}
 
     # Stage 3: Synthesize final answer with confidence
     stage3_result = await stage3_synthesize_final(
@@ -676,7 +1153,8 @@ async def run_full_council(
         stage2_results,
         label_to_model,
         quality_metrics,
-        chairman_model
+        chairman_model,
+        labeled_responses=labeled_responses
     )
 
     # Prepare metadata
@@ -700,9 +1178,9 @@ async def rewrite_query(query: str, conversation_history: List[Dict[str, str]])
     Returns:
         Rewritten self-contained query, or original if rewriting fails
     """
-    from .config import ENABLE_QUERY_REWRITE
-    
-    if not ENABLE_QUERY_REWRITE:
+    # Attribute lookup (not a from-import) so runtime flips of the flag
+    # still take effect
+    if not config.ENABLE_QUERY_REWRITE:
         return query
     
     # Heuristic: skip if query looks self-contained (>10 words)
@@ -711,11 +1189,16 @@ async def rewrite_query(query: str, conversation_history: List[Dict[str, str]])
         logger.info("[PHASE1] Query looks self-contained, skipping rewrite")
         return query
     
+    # Skip if there is nothing to resolve
+    if not _PRONOUN_RE.search(query):
+        logger.info("[PHASE1] No pronouns to resolve, skipping rewrite")
+        return query
+
     # Skip if no context available
     if not conversation_history or len(conversation_history) < 2:
         logger.info("[PHASE1] No context available, skipping rewrite")
         return query
-    
+
     # Build context from last 2 turns
     context_parts = []
     for msg in conversation_history[-4:]:  # Last 2 turns (user + assistant)
@@ -731,7 +1214,17 @@ async def rewrite_query(query: str, conversation_history: List[Dict[str, str]])
             context_parts.append(f"{role}: {content[:200]}")  # Truncate for cost
     
     context = "\n".join(context_parts)
-    
+
+    # Try a local coreference swap first: the last proper noun in the
+    # recent context is usually the antecedent for a short follow-up
+    local_rewrite = _resolve_pronouns_local(query, context)
+    if local_rewrite is not None:
+        logger.info(
+            "[PHASE1] Query rewritten locally: original=%r rewritten=%r",
+            query, local_rewrite,
+        )
+        return local_rewrite
+
     prompt = f"""Rewrite the user's question to be self-contained by replacing pronouns (it, its, that, they, etc.) with the specific topics from the conversation.
 
 Conversation context:
@@ -766,9 +1259,9 @@ Rewritten question (ONE sentence, no explanations):"""
                     rewritten = lines[0] if lines else rewritten
             
             # Remove common prefixes
-            for prefix in ["> ", "* ", "- ", "• ", "**"]:
-                if rewritten.startswith(prefix):
-                    rewritten = rewritten[len(prefix):].lstrip()
+            for prefix in _REWRITE_PREFIXES:
+                rewritten = rewritten.removeprefix(prefix)
+            rewritten = rewritten.lstrip()
             
             logger.info("[PHASE1] Query rewrite: original=%r", query)
             logger.info("[PHASE1] Query rewrite: rewritten=%r", rewritten)
@@ -852,7 +1345,6 @@ Guidance on context labels:
 
     # Query the chairman
     logger.info(f"[CHAIRMAN] Calling {target_chairman} with {len(messages)} messages...")
-    import time
     start_time = time.time()
     response = await query_model(target_chairman, messages)
     elapsed = time.time() - start_time
@@ -3,11 +3,11 @@
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
-from .config import CURATED_MODELS, RAG_SETTINGS
+from .config import MODEL_BY_ID, RAG_SETTINGS, get_preset
 from .logger import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMode:
     """Configuration for an execution mode."""
     name: str
@@ -122,51 +122,75 @@ MODEL_TIERS = {
 }
 
 
+# MODEL_TIERS and RAG_SETTINGS are static once config is loaded, so the
+# per-request helpers below read from tables materialized once at import
+# instead of re-walking the nested dicts on every call
+_TIER_MODELS: Dict[str, List[str]] = {
+    tier: cfg.get("preferred_models", []) for tier, cfg in MODEL_TIERS.items()
+}
+_TIER_PREFERRED_SETS: Dict[str, frozenset] = {
+    tier: frozenset(models) for tier, models in _TIER_MODELS.items()
+}
+_TIER_MAX_PRICE: Dict[str, float] = {
+    tier: cfg.get("max_input_price", 5.0) for tier, cfg in MODEL_TIERS.items()
+}
+
+
 def get_models_for_tier(tier: str) -> List[str]:
     """Get list of models for a tier."""
-    tier_config = MODEL_TIERS.get(tier, MODEL_TIERS["mid"])
-    return tier_config.get("preferred_models", [])
+    return _TIER_MODELS.get(tier, _TIER_MODELS["mid"])
 
 
 def select_chairman_for_tier(tier: str, current_chairman: str = None) -> str:
     """
     Select the best chairman model for a tier.
-    
+
     If current_chairman is set and matches the tier, keep it.
     Otherwise, select the first preferred model for the tier.
     """
-    tier_config = MODEL_TIERS.get(tier, MODEL_TIERS["mid"])
-    preferred = tier_config.get("preferred_models", [])
-    
+    if tier not in _TIER_MODELS:
+        tier = "mid"
+    preferred = _TIER_MODELS[tier]
+
     # Keep current if it matches tier preference
-    if current_chairman and current_chairman in preferred:
+    if current_chairman and current_chairman in _TIER_PREFERRED_SETS[tier]:
         return current_chairman
-    
+
     # Check current chairman pricing against tier
     if current_chairman:
-        for model in CURATED_MODELS:
-            if model["id"] == current_chairman:
-                input_price = model.get("pricing", {}).get("input", 5.0)
-                if input_price <= tier_config.get("max_input_price", 5.0):
-                    return current_chairman
-    
+        spec = MODEL_BY_ID.get(current_chairman)
+        if spec and spec.input_price <= _TIER_MAX_PRICE[tier]:
+            return current_chairman
+
     # Return first preferred model
     if preferred:
         return preferred[0]
-    
+
     # Fallback
     return "google/gemini-2.5-flash"
 
 
-def get_execution_summary(mode: ExecutionMode) -> Dict[str, Any]:
-    """Get a summary of execution mode settings for UI display."""
-    rag_tokens = RAG_SETTINGS["presets"].get(mode.rag_preset, {}).get("tokens", 8000)
-    
+def _build_execution_summary(mode: ExecutionMode) -> Dict[str, Any]:
     return {
         "name": mode.name,
         "label": mode.label,
         "description": mode.description,
-        "rag_tokens": rag_tokens,
+        "rag_tokens": get_preset(mode.rag_preset)["tokens"],
         "model_tier": mode.model_tier,
         "use_council": mode.use_council,
     }
+
+
+_EXECUTION_SUMMARIES: Dict[str, Dict[str, Any]] = {
+    name: _build_execution_summary(mode) for name, mode in EXECUTION_MODES.items()
+}
+
+
+def get_execution_summary(mode: ExecutionMode) -> Dict[str, Any]:
+    """Get a summary of execution mode settings for UI display."""
+    summary = _EXECUTION_SUMMARIES.get(mode.name)
+    if summary is None:
+        # Ad-hoc mode objects (not in EXECUTION_MODES) still get a summary
+        return _build_execution_summary(mode)
+    # Copy so callers can annotate without touching the shared table
+    return dict(summary)
@@ -8,16 +8,52 @@ Handles text extraction from various file types:
 Returns structured extraction results with confidence metrics.
 """
 
+import asyncio
+import base64
+import hashlib
 import io
 import csv
-import json
-from typing import Dict, Any, Optional, List
+import mmap
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from html import unescape
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from itertools import repeat
+from typing import Dict, Any, Callable, Optional, List
 from fastapi import UploadFile
+import msgspec
 import pypdf
 import docx
 
+# Optional extractors: import once at module load so the first uploaded
+# file doesn't pay the library's full import cost mid-request
+try:
+    from pptx import Presentation
+except ImportError:
+    Presentation = None
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
 from .openrouter import query_model
-from .config import OPENROUTER_API_KEY
 from .logger import logger
 
 # Limits
@@ -29,63 +65,69 @@ MAX_TEXT_LENGTH = 100000  # 100k characters (increased for multi-page docs)
 MIN_CHARS_THRESHOLD = 500  # If less than this, likely a scanned PDF
 MAX_EMPTY_PAGE_RATIO = 0.5  # If more than half pages empty, needs OCR
 
+# Below this page count the fork/pickle overhead of worker processes
+# outweighs the parallel win, so small PDFs stay on the serial path
+PDF_PARALLEL_MIN_PAGES = 8
+
+# Uploads above this size are spilled to a temp file and mmapped rather
+# than parsed out of a second in-heap copy
+LARGE_UPLOAD_SPILL_BYTES = 5 * 1024 * 1024
+
+# Re-uploads of the same file are common across council sessions; cache
+# extraction results keyed on content digest so identical bytes are
+# parsed (or sent to the vision model) only once per process. LRU only -
+# content is immutable, so entries never go stale.
+EXTRACTION_CACHE_MAX_ENTRIES = 256
+_extraction_cache: "OrderedDict[tuple, ExtractionResult]" = OrderedDict()
 
+
+@dataclass(slots=True)
 class ExtractionResult:
     """Structured extraction result."""
-    
-    def __init__(
-        self,
-        status: str = "success",
-        text: str = "",
-        method: str = "local",
-        warning: Optional[str] = None,
-        error: Optional[str] = None,
-        stats: Optional[Dict[str, Any]] = None
-    ):
-        self.status = status
-        self.text = text
-        self.method = method
-        self.warning = warning
-        self.error = error
-        self.stats = stats or {}
-    
+
+    status: str = "success"
+    text: str = ""
+    method: str = "local"
+    warning: Optional[str] = None
+    error: Optional[str] = None
+    stats: Dict[str, Any] = field(default_factory=dict)
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "status": self.status,
-            "text": self.text,
-            "method": self.method,
-            "warning": self.warning,
-            "error": self.error,
-            "stats": self.stats
-        }
+        return asdict(self)
+
+
+# Extension -> MIME type, keyed on lowercase extension; hoisted so the
+# dict is built once rather than per call
+_MIME_MAP = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'tsv': 'text/csv',
+    'txt': 'text/plain',
+    'md': 'text/markdown',
+    'html': 'text/html',
+    'htm': 'text/html',
+    'json': 'application/json',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+}
 
 
 def get_mime_type(filename: str, content_type: Optional[str]) -> str:
     """Normalize MIME type from filename extension if content_type is generic."""
     if content_type and content_type != "application/octet-stream":
         return content_type
-    
-    ext = filename.lower().split('.')[-1] if '.' in filename else ''
-    
-    mime_map = {
-        'pdf': 'application/pdf',
-        'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-        'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        'csv': 'text/csv',
-        'txt': 'text/plain',
-        'md': 'text/markdown',
-        'html': 'text/html',
-        'htm': 'text/html',
-        'json': 'application/json',
-        'jpg': 'image/jpeg',
-        'jpeg': 'image/jpeg',
-        'png': 'image/png',
-        'gif': 'image/gif',
-        'webp': 'image/webp',
-    }
-    
-    return mime_map.get(ext, content_type or 'application/octet-stream')
+
+    # rfind + slice lowercases only the extension, not the whole filename
+    dot = filename.rfind('.')
+    ext = filename[dot + 1:].lower() if dot >= 0 else ''
+
+    return _MIME_MAP.get(ext) or content_type or 'application/octet-stream'
 
 
 async def process_file(content: bytes, filename: str, mime_type: str) -> ExtractionResult:
@@ -111,42 +153,45 @@ async def process_file(content: bytes, filename: str, mime_type: str) -> Extract
             status="failed",
             error=f"File too large ({len(content) / 1024 / 1024:.1f}MB). Max: {MAX_FILE_SIZE_MB:.0f}MB."
         )
-    
+
+    # Cache lookup: the key covers the MIME type (it drives routing) and
+    # the extension (it drives CSV delimiter detection) alongside the
+    # content digest
+    dot = filename.rfind('.')
+    ext = filename[dot + 1:].lower() if dot >= 0 else ''
+    cache_key = (hashlib.blake2b(content, digest_size=16).digest(), mime_type, ext)
+    cached = _extraction_cache.get(cache_key)
+    if cached is not None:
+        _extraction_cache.move_to_end(cache_key)
+        logger.info(f"[EXTRACT] Extraction cache hit for {filename}")
+        return cached
+
     try:
-        # Route to appropriate extractor
-        if mime_type == 'application/pdf':
-            return _extract_pdf(content)
-        
-        elif mime_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-            return _extract_docx(content)
-        
-        elif mime_type == 'application/vnd.openxmlformats-officedocument.presentationml.presentation':
-            return _extract_pptx(content)
-        
-        elif mime_type == 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet':
-            return _extract_xlsx(content)
-        
-        elif mime_type == 'text/csv':
-            return _extract_csv(content)
-        
-        elif mime_type in ('text/plain', 'text/markdown'):
-            return _extract_text(content)
-        
-        elif mime_type == 'text/html':
-            return _extract_html(content)
-        
-        elif mime_type == 'application/json':
-            return _extract_json(content)
-        
+        # Route to the appropriate extractor via the dispatch table
+        handler = _SYNC_HANDLERS.get(mime_type)
+
+        if handler is _extract_pdf:
+            # pypdf parsing is CPU-bound; run it off the event loop so a
+            # large upload doesn't stall concurrent requests
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, _extract_pdf, content
+            )
+
+        elif handler is _extract_csv:
+            result = _extract_csv(content, filename)
+
+        elif handler is not None:
+            result = handler(content)
+
         elif mime_type.startswith('image/'):
-            return await _extract_image(content, mime_type)
-        
+            result = await _extract_image(content, mime_type)
+
         else:
             return ExtractionResult(
                 status="failed",
                 error=f"Unsupported file type: {mime_type}"
             )
-    
+
     except Exception as e:
         logger.error(f"[EXTRACT] Error processing {filename}: {e}")
         return ExtractionResult(
@@ -154,28 +199,170 @@ async def process_file(content: bytes, filename: str, mime_type: str) -> Extract
             error=f"Extraction failed: {str(e)}"
         )
 
+    # Failures (including transient vision-model errors) are never
+    # cached so a retry gets a fresh attempt
+    if result.status != "failed":
+        _extraction_cache[cache_key] = result
+        if len(_extraction_cache) > EXTRACTION_CACHE_MAX_ENTRIES:
+            _extraction_cache.popitem(last=False)
 
-def _extract_pdf(content: bytes) -> ExtractionResult:
-    """Extract text from PDF with confidence metrics."""
-    pdf_file = io.BytesIO(content)
-    reader = pypdf.PdfReader(pdf_file)
-    
-    page_texts = []
+    return result
+
+
+def _page_has_text(page) -> bool:
+    """Cheap peek for text-showing operators in a page's content stream.
+
+    Scanned pages carry image-only streams; a byte scan for the Tj/TJ/'/\"
+    operators is far cheaper than pypdf's full operator walk, so empty
+    pages are detected without running extract_text at all. A Do operator
+    also counts as text-bearing: it draws a Form XObject whose own stream
+    (which extract_text recurses into, but this peek does not) may show
+    text. Any doubt (no peekable stream, odd structure) falls back to
+    full extraction.
+    """
+    try:
+        contents = page.get_contents()
+        if contents is None:
+            return False
+        data = contents.get_data()
+    except Exception:
+        return True
+    return (
+        b'Tj' in data or b'TJ' in data or b"'" in data or b'"' in data
+        or b'Do' in data
+    )
+
+
+def _extract_pdf_page(source, page_index: int) -> str:
+    """Extract a single PDF page's text.
+
+    Top-level (picklable) so it can run in a ProcessPoolExecutor worker.
+    `source` is either the raw bytes or the path of a spilled temp file;
+    spilled files are mmapped so workers share the page cache instead of
+    each holding a heap copy of the upload.
+    """
+    try:
+        if isinstance(source, bytes):
+            page = pypdf.PdfReader(io.BytesIO(source)).pages[page_index]
+            if not _page_has_text(page):
+                return ""
+            return page.extract_text() or ""
+        with open(source, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                page = pypdf.PdfReader(mm).pages[page_index]
+                if not _page_has_text(page):
+                    return ""
+                return page.extract_text() or ""
+    except Exception as e:
+        logger.warning(f"[EXTRACT] Failed to extract page {page_index + 1}: {e}")
+        return ""
+
+
+def _write_pdf_pages(buf: io.StringIO, texts) -> int:
+    """Stream page texts into a single buffer in page order.
+
+    Writing straight into the buffer avoids holding a page-text list, the
+    formatted copies, and the joined result in memory at once. Stops as
+    soon as the buffer passes MAX_TEXT_LENGTH — truncation is guaranteed
+    at that point, so later pages are never formatted (and, on the serial
+    path's lazy iterator, never parsed). Returns the empty-page count.
+    """
     empty_pages = 0
-    
-    for i, page in enumerate(reader.pages):
-        try:
-            text = page.extract_text() or ""
-            page_texts.append(f"[Page {i + 1}]\n{text}" if text.strip() else "")
-            if not text.strip():
-                empty_pages += 1
-        except Exception as e:
-            logger.warning(f"[EXTRACT] Failed to extract page {i + 1}: {e}")
-            page_texts.append("")
+    for i, text in enumerate(texts):
+        if text.strip():
+            # Direct writes beat per-page f-string formatting: no
+            # intermediate header string per iteration
+            buf.write("[Page ")
+            buf.write(str(i + 1))
+            buf.write("]\n")
+            buf.write(text)
+            buf.write("\n\n")
+            if buf.tell() > MAX_TEXT_LENGTH:
+                break
+        else:
             empty_pages += 1
-    
-    full_text = "\n\n".join(filter(None, page_texts))
+    return empty_pages
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Shared process pool for parallel PDF page extraction.
+
+    Created once and reused for the process lifetime: forking a fresh
+    pool per upload — from a worker thread of a running event loop, no
+    less — is both slow and fragile.
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _pdf_pool
+
+
+def _extract_pdf(content: bytes) -> ExtractionResult:
+    """Extract text from PDF with confidence metrics."""
+    if len(content) > LARGE_UPLOAD_SPILL_BYTES:
+        # Spill big uploads to a temp file and mmap it: reads go through
+        # the OS page cache instead of a second heap copy in BytesIO, and
+        # parallel workers receive the path rather than a pickled copy of
+        # the whole file each
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as tf:
+            tf.write(content)
+            tf.flush()
+            with mmap.mmap(tf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _extract_pdf_stream(mm, tf.name)
+
+    return _extract_pdf_stream(io.BytesIO(content), content)
+
+
+def _extract_pdf_stream(stream, source) -> ExtractionResult:
+    """Shared PDF extraction over an open stream.
+
+    `source` is what parallel workers re-open the document from: the raw
+    bytes for in-memory PDFs, or the spill-file path for mmapped ones.
+    """
+    reader = pypdf.PdfReader(stream)
     page_count = len(reader.pages)
+
+    buf = io.StringIO()
+
+    if page_count > PDF_PARALLEL_MIN_PAGES:
+        # Page parsing is CPU-bound and independent per page; fan the
+        # pages out across the shared worker pool and collect in page
+        # order. Workers always receive a file path — shipping the raw
+        # bytes would pickle the whole document to every worker per page
+        # — so in-memory documents are spilled to a temp file first
+        pool = _get_pdf_pool()
+        if isinstance(source, bytes):
+            with tempfile.NamedTemporaryFile(suffix=".pdf") as tf:
+                tf.write(source)
+                tf.flush()
+                empty_pages = _write_pdf_pages(
+                    buf, pool.map(_extract_pdf_page, repeat(tf.name), range(page_count))
+                )
+        else:
+            empty_pages = _write_pdf_pages(
+                buf, pool.map(_extract_pdf_page, repeat(source), range(page_count))
+            )
+    else:
+        def _serial_texts():
+            for i, page in enumerate(reader.pages):
+                try:
+                    if not _page_has_text(page):
+                        yield ""
+                        continue
+                    yield page.extract_text() or ""
+                except Exception as e:
+                    logger.warning(f"[EXTRACT] Failed to extract page {i + 1}: {e}")
+                    yield ""
+
+        empty_pages = _write_pdf_pages(buf, _serial_texts())
+
+    full_text = buf.getvalue().rstrip("\n")
     char_count = len(full_text)
     empty_ratio = empty_pages / page_count if page_count > 0 else 1.0
     
@@ -214,16 +401,102 @@ def _extract_pdf(content: bytes) -> ExtractionResult:
     )
 
 
+# WordprocessingML tags needed for the streaming DOCX parse
+_DOCX_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_DOCX_T = f'{{{_DOCX_NS}}}t'
+_DOCX_P = f'{{{_DOCX_NS}}}p'
+_DOCX_TBL = f'{{{_DOCX_NS}}}tbl'
+_DOCX_TR = f'{{{_DOCX_NS}}}tr'
+_DOCX_TC = f'{{{_DOCX_NS}}}tc'
+
+
+def _parse_docx_xml(f) -> tuple:
+    """Stream word/document.xml and collect paragraph and table text.
+
+    iterparse walks the XML in C without building python-docx's full
+    object model (paragraphs, runs, styles); only the <w:t> text and
+    enough structure to keep tables separate is touched.
+    """
+    paragraphs = []
+    table_texts = []
+    run_parts = []   # text runs of the current body paragraph
+    cell_parts = []  # text runs of the current table cell
+    row_cells = []
+    table_rows = []
+    table_depth = 0
+
+    for event, elem in lxml_etree.iterparse(
+        f, events=('start', 'end'),
+        tag=(_DOCX_P, _DOCX_T, _DOCX_TBL, _DOCX_TR, _DOCX_TC),
+    ):
+        if event == 'start':
+            if elem.tag == _DOCX_TBL:
+                table_depth += 1
+            continue
+
+        tag = elem.tag
+        if tag == _DOCX_T:
+            if elem.text:
+                (cell_parts if table_depth else run_parts).append(elem.text)
+        elif tag == _DOCX_P:
+            if not table_depth:
+                text = ''.join(run_parts)
+                run_parts.clear()
+                if text.strip():
+                    paragraphs.append(text)
+                elem.clear()
+        elif tag == _DOCX_TC:
+            cell_text = ''.join(cell_parts).strip()
+            cell_parts.clear()
+            if cell_text:
+                row_cells.append(cell_text)
+        elif tag == _DOCX_TR:
+            if row_cells:
+                table_rows.append(' | '.join(row_cells))
+                row_cells.clear()
+        elif tag == _DOCX_TBL:
+            table_depth -= 1
+            if table_rows and not table_depth:
+                table_texts.append('\n'.join(table_rows))
+                table_rows.clear()
+            elem.clear()
+
+    return paragraphs, table_texts
+
+
 def _extract_docx(content: bytes) -> ExtractionResult:
     """Extract text from DOCX."""
+    if lxml_etree is None:
+        return _extract_docx_fallback(content)
+
+    # A DOCX is a zip around word/document.xml; streaming the XML
+    # directly skips python-docx's DOM construction entirely
+    with zipfile.ZipFile(io.BytesIO(content)) as z:
+        with z.open('word/document.xml') as f:
+            paragraphs, table_texts = _parse_docx_xml(f)
+
+    full_text = "\n\n".join(paragraphs)
+    if table_texts:
+        full_text += "\n\n[Tables]\n" + "\n\n".join(table_texts)
+
+    return ExtractionResult(
+        status="success",
+        text=full_text,
+        method="local",
+        stats={"char_count": len(full_text)}
+    )
+
+
+def _extract_docx_fallback(content: bytes) -> ExtractionResult:
+    """python-docx fallback for when lxml is not installed."""
     docx_file = io.BytesIO(content)
     doc = docx.Document(docx_file)
-    
+
     paragraphs = []
     for para in doc.paragraphs:
         if para.text.strip():
             paragraphs.append(para.text)
-    
+
     # Also extract tables
     table_texts = []
     for table in doc.tables:
@@ -234,7 +507,7 @@ def _extract_docx(content: bytes) -> ExtractionResult:
                 table_rows.append(row_text)
         if table_rows:
             table_texts.append("\n".join(table_rows))
-    
+
     full_text = "\n\n".join(paragraphs)
     if table_texts:
         full_text += "\n\n[Tables]\n" + "\n\n".join(table_texts)
@@ -249,14 +522,12 @@ def _extract_docx(content: bytes) -> ExtractionResult:
 
 def _extract_pptx(content: bytes) -> ExtractionResult:
     """Extract text from PPTX (PowerPoint)."""
-    try:
-        from pptx import Presentation
-    except ImportError:
+    if Presentation is None:
         return ExtractionResult(
             status="failed",
             error="PPTX support not installed. Run: pip install python-pptx"
         )
-    
+
     pptx_file = io.BytesIO(content)
     prs = Presentation(pptx_file)
     
@@ -286,16 +557,20 @@ def _extract_pptx(content: bytes) -> ExtractionResult:
     )
 
 
+def _fast_cell_str(v) -> str:
+    """Format a spreadsheet cell value, skipping str() for the common
+    already-string case (exact type check beats isinstance here)."""
+    return '' if v is None else v if type(v) is str else str(v)
+
+
 def _extract_xlsx(content: bytes) -> ExtractionResult:
     """Extract data from XLSX (Excel)."""
-    try:
-        from openpyxl import load_workbook
-    except ImportError:
+    if load_workbook is None:
         return ExtractionResult(
             status="failed",
             error="XLSX support not installed. Run: pip install openpyxl"
         )
-    
+
     xlsx_file = io.BytesIO(content)
     wb = load_workbook(xlsx_file, read_only=True, data_only=True)
     
@@ -305,20 +580,26 @@ def _extract_xlsx(content: bytes) -> ExtractionResult:
     for sheet_name in wb.sheetnames:
         sheet_count += 1
         ws = wb[sheet_name]
-        
-        rows = []
+
+        # values_only skips openpyxl's Cell object construction (the
+        # dominant cost of a read); the emptiness check runs before any
+        # formatting so dropped rows never materialize strings at all
+        sheet_buf = io.StringIO()
         row_count = 0
-        for row in ws.iter_rows(max_row=1000):  # Limit rows to avoid huge outputs
-            row_values = [str(cell.value) if cell.value is not None else "" for cell in row]
-            if any(v.strip() for v in row_values):
-                rows.append(" | ".join(row_values))
-                row_count += 1
-        
-        if rows:
+        for row in ws.iter_rows(max_row=1000, values_only=True):  # Limit rows to avoid huge outputs
+            if not any(v is not None and (type(v) is not str or v.strip()) for v in row):
+                continue
+            row_count += 1
+            if row_count <= 100:  # Limit displayed rows
+                sheet_buf.write(" | ".join(map(_fast_cell_str, row)))
+                sheet_buf.write("\n")
+
+        if row_count:
             sheet_header = f"[Sheet: {sheet_name}] ({row_count} rows)"
-            sheets_text.append(f"{sheet_header}\n" + "\n".join(rows[:100]))  # Limit displayed rows
+            body = sheet_buf.getvalue().rstrip("\n")
             if row_count > 100:
-                sheets_text[-1] += f"\n[...{row_count - 100} more rows...]"
+                body += f"\n[...{row_count - 100} more rows...]"
+            sheets_text.append(f"{sheet_header}\n{body}")
     
     wb.close()
     full_text = "\n\n".join(sheets_text)
@@ -331,16 +612,23 @@ def _extract_xlsx(content: bytes) -> ExtractionResult:
     )
 
 
-def _extract_csv(content: bytes) -> ExtractionResult:
-    """Extract data from CSV."""
+def _extract_csv(content: bytes, filename: str = "") -> ExtractionResult:
+    """Extract data from CSV/TSV."""
     text = content.decode('utf-8', errors='replace')
-    
-    # Try to detect delimiter
-    try:
-        dialect = csv.Sniffer().sniff(text[:4096])
-        delimiter = dialect.delimiter
-    except csv.Error:
+
+    # A known extension already fixes the delimiter; the pure-Python
+    # Sniffer pass is only worth running for ambiguous filenames
+    lowered = filename.lower()
+    if lowered.endswith('.tsv'):
+        delimiter = '\t'
+    elif lowered.endswith('.csv'):
         delimiter = ','
+    else:
+        try:
+            dialect = csv.Sniffer().sniff(text[:4096])
+            delimiter = dialect.delimiter
+        except csv.Error:
+            delimiter = ','
     
     reader = csv.reader(io.StringIO(text), delimiter=delimiter)
     rows = []
@@ -367,9 +655,13 @@ def _extract_csv(content: bytes) -> ExtractionResult:
 
 def _extract_text(content: bytes) -> ExtractionResult:
     """Extract plain text / markdown."""
-    text = content.decode('utf-8', errors='replace')
-    
-    if len(text) > MAX_TEXT_LENGTH:
+    # UTF-8 is at most 4 bytes per character, so only the prefix that can
+    # contribute to the kept text needs decoding; a 50MB upload no longer
+    # materializes 50MB of str just to keep the first 100k characters
+    byte_budget = MAX_TEXT_LENGTH * 4
+    text = content[:byte_budget].decode('utf-8', errors='replace')
+
+    if len(text) > MAX_TEXT_LENGTH or len(content) > byte_budget:
         text = text[:MAX_TEXT_LENGTH] + "\n\n[...content truncated...]"
         return ExtractionResult(
             status="success",
@@ -387,26 +679,116 @@ def _extract_text(content: bytes) -> ExtractionResult:
     )
 
 
+# Fast path for small, ordinary HTML: a C-level regex scrub over the raw
+# bytes avoids building a DOM at all. Documents with constructs the
+# scrub can't handle safely (svg/math islands) or an unbalanced script/
+# style tag take the lxml path instead.
+HTML_FAST_MAX_BYTES = 200 * 1024
+_HTML_COMMENT_RE = re.compile(rb'<!--.*?-->', re.S)
+_HTML_DROP_RE = re.compile(rb'<(script|style|nav|footer|header)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+_HTML_DECLINE_RE = re.compile(rb'<(?:script|style|svg|math)\b', re.I)
+_HTML_TAG_RE = re.compile(rb'<[^>]+>')
+_HTML_WS_RE = re.compile(r'\s+')
+
+
+def _extract_html_fast(content: bytes) -> Optional[str]:
+    """Regex text scrub for small HTML; returns None to decline."""
+    stripped = _HTML_DROP_RE.sub(b' ', _HTML_COMMENT_RE.sub(b' ', content))
+    # Any script/style/svg/math left after the scrub means an unclosed or
+    # nested construct the regexes would mangle; let the DOM parser do it
+    if _HTML_DECLINE_RE.search(stripped):
+        return None
+    text = unescape(_HTML_TAG_RE.sub(b' ', stripped).decode('utf-8', 'replace'))
+    return _HTML_WS_RE.sub(' ', text).strip()
+
+
 def _extract_html(content: bytes) -> ExtractionResult:
     """Extract text from HTML."""
+    if not content.strip():
+        return ExtractionResult(
+            status="success",
+            text="",
+            method="local",
+            stats={"char_count": 0}
+        )
+
+    if len(content) <= HTML_FAST_MAX_BYTES:
+        text = _extract_html_fast(content)
+        if text is not None:
+            if len(text) > MAX_TEXT_LENGTH:
+                text = text[:MAX_TEXT_LENGTH] + "\n\n[...content truncated...]"
+            return ExtractionResult(
+                status="success",
+                text=text,
+                method="local",
+                stats={"char_count": len(text)}
+            )
+
+    if lxml_html is None:
+        return _extract_html_bs4(content)
+
+    # lxml parses in C (several times faster than html.parser) and
+    # strip_elements drops all boilerplate tags in a single tree walk
+    html = content.decode('utf-8', errors='replace')
     try:
-        from bs4 import BeautifulSoup
-    except ImportError:
+        tree = lxml_html.fromstring(html)
+    except ValueError:
+        # lxml rejects str input carrying an XML encoding declaration;
+        # hand it the raw bytes and let it honor the declared encoding
+        tree = lxml_html.fromstring(content)
+    lxml_etree.strip_elements(
+        tree, 'script', 'style', 'nav', 'footer', 'header', lxml_etree.Comment,
+        with_tail=False
+    )
+
+    buf = io.StringIO()
+    for chunk in tree.itertext():
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        buf.write(chunk)
+        buf.write('\n')
+        if buf.tell() > MAX_TEXT_LENGTH:
+            break
+    text = buf.getvalue().rstrip('\n')
+
+    if len(text) > MAX_TEXT_LENGTH:
+        text = text[:MAX_TEXT_LENGTH] + "\n\n[...content truncated...]"
+
+    return ExtractionResult(
+        status="success",
+        text=text,
+        method="local",
+        stats={"char_count": len(text)}
+    )
+
+
+def _extract_html_bs4(content: bytes) -> ExtractionResult:
+    """BeautifulSoup fallback for when lxml is not installed."""
+    if BeautifulSoup is None:
         return ExtractionResult(
             status="failed",
-            error="HTML parsing not installed. Run: pip install beautifulsoup4"
+            error="HTML parsing not installed. Run: pip install lxml"
         )
-    
+
     html = content.decode('utf-8', errors='replace')
     soup = BeautifulSoup(html, 'html.parser')
-    
+
     # Remove script and style elements
     for element in soup(['script', 'style', 'nav', 'footer', 'header']):
         element.decompose()
-    
-    # Extract text
-    text = soup.get_text(separator='\n', strip=True)
-    
+
+    # Extract text lazily: stripped_strings yields what get_text would
+    # join, so accumulation can stop at the cap instead of materializing
+    # the full document text and then throwing most of it away
+    buf = io.StringIO()
+    for chunk in soup.stripped_strings:
+        buf.write(chunk)
+        buf.write('\n')
+        if buf.tell() > MAX_TEXT_LENGTH:
+            break
+    text = buf.getvalue().rstrip('\n')
+
     if len(text) > MAX_TEXT_LENGTH:
         text = text[:MAX_TEXT_LENGTH] + "\n\n[...content truncated...]"
     
@@ -420,23 +802,23 @@ def _extract_html(content: bytes) -> ExtractionResult:
 
 def _extract_json(content: bytes) -> ExtractionResult:
     """Extract and format JSON."""
-    text = content.decode('utf-8', errors='replace')
-    
     try:
-        data = json.loads(text)
-        # Pretty print with truncation for large arrays
-        formatted = json.dumps(data, indent=2, ensure_ascii=False)
-        
+        # msgspec validates and re-indents the raw bytes in C without ever
+        # materializing Python objects (no loads/dumps round-trip, no
+        # upfront decode of the whole upload)
+        formatted = msgspec.json.format(content, indent=2).decode('utf-8', errors='replace')
+
         if len(formatted) > MAX_TEXT_LENGTH:
             formatted = formatted[:MAX_TEXT_LENGTH] + "\n\n[...JSON truncated...]"
-        
+
         return ExtractionResult(
             status="success",
             text=formatted,
             method="local",
             stats={"char_count": len(formatted)}
         )
-    except json.JSONDecodeError as e:
+    except msgspec.DecodeError as e:
+        text = content.decode('utf-8', errors='replace')
         return ExtractionResult(
             status="partial",
             text=text[:MAX_TEXT_LENGTH],
@@ -446,12 +828,62 @@ def _extract_json(content: bytes) -> ExtractionResult:
         )
 
 
+# Dispatch table: one dict lookup instead of an equality check per
+# supported type, and the supported types become introspectable. Images
+# are matched by prefix in process_file; PDFs run in an executor there.
+_SYNC_HANDLERS: Dict[str, Callable[[bytes], ExtractionResult]] = {
+    'application/pdf': _extract_pdf,
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': _extract_docx,
+    'application/vnd.openxmlformats-officedocument.presentationml.presentation': _extract_pptx,
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': _extract_xlsx,
+    'text/csv': _extract_csv,
+    'text/plain': _extract_text,
+    'text/markdown': _extract_text,
+    'text/html': _extract_html,
+    'application/json': _extract_json,
+}
+
+
+# Vision models gain nothing above ~2K pixels; bigger images only
+# inflate the base64 payload, so they are downscaled when Pillow is
+# available. Small images skip the attempt entirely.
+MAX_IMAGE_DIMENSION = 2048
+IMAGE_DOWNSCALE_MIN_BYTES = 1024 * 1024
+
+
+def _encode_image_payload(content: bytes, mime_type: str) -> str:
+    """Downscale (when possible) and build the base64 data URL.
+
+    Runs in a worker thread: the Pillow re-encode, b64encode, and the
+    multi-MB data-URL assembly are all CPU-bound and would stall the
+    event loop on large uploads.
+    """
+    if len(content) >= IMAGE_DOWNSCALE_MIN_BYTES:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+
+        if Image is not None:
+            try:
+                img = Image.open(io.BytesIO(content))
+                if max(img.size) > MAX_IMAGE_DIMENSION:
+                    img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+                    out = io.BytesIO()
+                    img.convert("RGB").save(out, format="JPEG", quality=85)
+                    content = out.getvalue()
+                    mime_type = "image/jpeg"
+            except Exception as e:
+                logger.warning(f"[EXTRACT] Image downscale failed, sending original: {e}")
+
+    return f"data:{mime_type};base64," + base64.b64encode(content).decode("ascii")
+
+
 async def _extract_image(content: bytes, mime_type: str) -> ExtractionResult:
     """Describe image using vision model."""
-    import base64
-    
-    base64_image = base64.b64encode(content).decode("utf-8")
-    data_url = f"data:{mime_type};base64,{base64_image}"
+    data_url = await asyncio.get_running_loop().run_in_executor(
+        None, _encode_image_payload, content, mime_type
+    )
     
     messages = [
         {
@@ -103,7 +103,14 @@ class HybridRetriever:
         logger.info("[HybridRetriever] Getting BM25 scores...")
         bm25_scores = self.bm25_index.get_scores(query_tokens)
         logger.info("[HybridRetriever] BM25 scores computed, getting top indices...")
-        bm25_top_indices = np.argsort(bm25_scores)[::-1][: top_k * 2]
+        # argpartition selects the top candidates in O(N) before the small
+        # O(k log k) sort, instead of fully sorting every indexed document
+        n_candidates = min(top_k * 2, len(bm25_scores))
+        if n_candidates < len(bm25_scores):
+            candidates = np.argpartition(bm25_scores, -n_candidates)[-n_candidates:]
+            bm25_top_indices = candidates[np.argsort(bm25_scores[candidates])[::-1]]
+        else:
+            bm25_top_indices = np.argsort(bm25_scores)[::-1]
         logger.info("[HybridRetriever] Found %d BM25 top indices", len(bm25_top_indices))
 
         bm25_results: Dict[str, Any] = {}
@@ -1,49 +1,99 @@
 """FastAPI backend for LLM Council."""
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from fastapi.responses import Response, StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Optional
 import uuid
-import json
 import asyncio
 
+import msgspec
+
 from . import storage
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings, chat_with_chairman, run_tool_steward_phase
+from .council import run_full_council, generate_conversation_title, stage1_collect_responses_iter, stage2_collect_rankings, stage3_synthesize_final, stage3_synthesize_final_stream, calculate_aggregate_rankings, chat_with_chairman, run_tool_steward_phase
 from .rag import CouncilRAG
 from .file_processing import extract_text_from_file, process_file, get_mime_type
 from .attachment_storage import (
     create_attachment, get_attachment, update_attachment_status,
     save_attachment_text, get_attachment_text, build_llm_context,
-    Attachment
+    compute_sha256_batch, Attachment
 )
 from .logger import logger
 
 # Initialize RAG system
 rag_system = CouncilRAG()
 
-def get_turn_index(conversation: Dict[str, Any]) -> int:
-    """Count the number of completed Council turns (messages with stage3)."""
-    count = 0
-    for msg in conversation.get("messages", []):
-        if msg.get("role") == "assistant" and "stage3" in msg:
-            count += 1
-    return count
+
+def _sse(obj: Dict[str, Any]) -> bytes:
+    """Encode one SSE event as bytes.
+
+    msgspec serializes in C straight to UTF-8 bytes, which matters on the
+    streaming path where the large stage payloads are re-encoded per
+    event; StreamingResponse passes the bytes through untouched.
+    """
+    return b"data: " + msgspec.json.encode(obj) + b"\n\n"
+
+
+# Payload-free stage markers are identical on every request, so they are
+# encoded once at import instead of per yield
+_STEWARD_START = _sse({'type': 'steward_start'})
+_STAGE1_START = _sse({'type': 'stage1_start'})
+_STAGE2_START = _sse({'type': 'stage2_start'})
+_STAGE3_START = _sse({'type': 'stage3_start'})
+_CHAT_START = _sse({'type': 'chat_start'})
+
+
+# Strong references to fire-and-forget indexing tasks: the event loop
+# only holds weak ones, so an unreferenced task can be garbage-collected
+# before it ever runs
+_background_index_tasks: set = set()
+
+
+def _index_council_turn(
+    conversation_id: str,
+    turn_index: int,
+    question: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    stage3_result: Dict[str, Any],
+    topics: List[str],
+    quality_metrics: Dict[str, Any],
+):
+    """Index a completed council turn for RAG and refresh the hybrid index.
+
+    Runs off the response path (background task / worker thread): the
+    embedding computation and vector store write no longer delay the
+    client's final response. The assistant message is already persisted
+    by the time this is scheduled, so a failed index only costs recall.
+    """
+    try:
+        rag_system.index_session(
+            conversation_id,
+            turn_index,
+            question,
+            stage1_results,
+            stage2_results,
+            stage3_result,
+            topics,
+            quality_metrics,
+        )
+        rag_system.refresh_hybrid_index()
+        logger.info("[PHASE1] Indexed turn %d for conversation %s", turn_index, conversation_id)
+    except Exception as e:
+        logger.error("[PHASE1] Background indexing failed for %s: %s", conversation_id, e)
+
 
 def calculate_cost(usage: Dict[str, int], model_id: str) -> float:
     """Calculate cost based on usage and model pricing."""
     if not usage:
         return 0.0
     
-    from .config import AVAILABLE_MODELS
-    model_config = next((m for m in AVAILABLE_MODELS if m['id'] == model_id), None)
-    if not model_config:
+    from .config import MODEL_PRICES
+    prices = MODEL_PRICES.get(model_id)
+    if prices is None:
         return 0.0
-    
-    pricing = model_config.get('pricing', {})
-    input_price = pricing.get('input', 0.0)
-    output_price = pricing.get('output', 0.0)
+
+    input_price, output_price = prices
     
     prompt_tokens = usage.get('prompt_tokens', 0)
     completion_tokens = usage.get('completion_tokens', 0)
@@ -51,7 +101,20 @@ def calculate_cost(usage: Dict[str, int], model_id: str) -> float:
     cost = (prompt_tokens / 1_000_000) * input_price + (completion_tokens / 1_000_000) * output_price
     return cost
 
-app = FastAPI(title="LLM Council API")
+class MsgspecJSONResponse(Response):
+    """JSON response rendered by msgspec instead of the stdlib encoder.
+
+    Endpoints return plain dicts/lists, so encoding straight to bytes in
+    C skips both json.dumps and FastAPI's jsonable_encoder pass — the
+    win scales with payload size (conversation lists, stage results).
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
+
+
+app = FastAPI(title="LLM Council API", default_response_class=MsgspecJSONResponse)
 
 # Enable CORS for local development
 app.add_middleware(
@@ -63,24 +126,42 @@ app.add_middleware(
 )
 
 
-class CreateConversationRequest(BaseModel):
+class CreateConversationRequest(msgspec.Struct):
     """Request to create a new conversation."""
     topic: str = "New Conversation"
-    council_members: List[str] = None
-    chairman_model: str = None
+    council_members: Optional[List[str]] = None
+    chairman_model: Optional[str] = None
+
+
+_create_conversation_decoder = msgspec.json.Decoder(CreateConversationRequest)
+
+
+def _decode_body(body: bytes, decoder: msgspec.json.Decoder):
+    """Decode a JSON request body with msgspec, mapping failures to HTTP errors.
+
+    msgspec validates against the Struct annotations during decode, so a
+    single C pass replaces the parse-then-validate round trip Pydantic
+    models go through on every request.
+    """
+    try:
+        return decoder.decode(body)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
 
 
 @app.post("/api/conversations")
-async def create_conversation(request: CreateConversationRequest):
+async def create_conversation(http_request: Request):
     """Create a new conversation."""
+    request = _decode_body(await http_request.body(), _create_conversation_decoder)
     conversation_id = str(uuid.uuid4())
     metadata = {}
     
     # Validate council members
     if request.council_members:
-        from .config import AVAILABLE_MODELS
-        valid_models = {m['id'] for m in AVAILABLE_MODELS}
-        invalid = [m for m in request.council_members if m not in valid_models]
+        from .config import MODEL_BY_ID
+        invalid = [m for m in request.council_members if m not in MODEL_BY_ID]
         if invalid:
             raise HTTPException(
                 status_code=400, 
@@ -90,9 +171,8 @@ async def create_conversation(request: CreateConversationRequest):
         
     # Validate chairman model
     if request.chairman_model:
-        from .config import AVAILABLE_MODELS
-        valid_models = {m['id'] for m in AVAILABLE_MODELS}
-        if request.chairman_model not in valid_models:
+        from .config import MODEL_BY_ID
+        if request.chairman_model not in MODEL_BY_ID:
             raise HTTPException(
                 status_code=400, 
                 detail=f"Invalid chairman model: {request.chairman_model}"
@@ -103,14 +183,17 @@ async def create_conversation(request: CreateConversationRequest):
     return conversation
 
 
-class SendMessageRequest(BaseModel):
+class SendMessageRequest(msgspec.Struct):
     """Request to send a message in a conversation."""
     content: str
     mode: str = "auto"  # "auto", "council", or "chat"
     attachment_ids: List[str] = []  # List of attachment IDs to include
 
 
-class ConversationMetadata(BaseModel):
+_send_message_decoder = msgspec.json.Decoder(SendMessageRequest)
+
+
+class ConversationMetadata(msgspec.Struct):
     """Conversation metadata for list view."""
     id: str
     created_at: str
@@ -118,7 +201,7 @@ class ConversationMetadata(BaseModel):
     message_count: int
 
 
-class Conversation(BaseModel):
+class Conversation(msgspec.Struct):
     """Full conversation with all messages."""
     id: str
     created_at: str
@@ -137,8 +220,8 @@ async def get_models():
     """Get list of available models with live pricing from OpenRouter."""
     from .config import CURATED_MODELS
     from .openrouter_client import get_enriched_models
-    
-    enriched = await get_enriched_models(CURATED_MODELS)
+
+    enriched = await get_enriched_models([m.as_dict() for m in CURATED_MODELS])
     return {"models": enriched}
 
 
@@ -168,10 +251,12 @@ async def get_conversation(conversation_id: str):
 
 
 @app.post("/api/conversations/{conversation_id}/message")
-async def send_message(conversation_id: str, request: SendMessageRequest):
+async def send_message(conversation_id: str, http_request: Request, background_tasks: BackgroundTasks):
     """
     Send a message and run the 3-stage council process OR chat with chairman.
     """
+    request = _decode_body(await http_request.body(), _send_message_decoder)
+
     # Check if conversation exists
     conversation = storage.get_conversation(conversation_id)
     if conversation is None:
@@ -184,13 +269,15 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     if mode == "auto":
         mode = "council" if is_first_message else "chat"
 
-    # Add user message
-    storage.add_user_message(conversation_id, request.content)
+    # Add user message; keep the returned dict so later steps don't
+    # have to re-read the conversation file
+    conversation = storage.add_user_message(conversation_id, request.content)
 
-    # If this is the first message, generate a title
+    # If this is the first message, start title generation in parallel
+    # with the council/chat work and collect it before returning
+    title_task = None
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
+        title_task = asyncio.create_task(generate_conversation_title(request.content))
 
     # Get model configuration from conversation metadata
     metadata = conversation.get("metadata", {})
@@ -208,8 +295,12 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
             chairman_model=chairman_model
         )
 
+        # Title generation overlapped with the council run; collect it now
+        if title_task:
+            storage.update_conversation_title(conversation_id, await title_task)
+
         # Add assistant message with all stages and metadata
-        storage.add_assistant_message(
+        turn_index = storage.add_assistant_message(
             conversation_id,
             stage1_results,
             stage2_results,
@@ -217,25 +308,20 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
             metadata  # Contains label_to_model for analytics
         )
 
-        # Index the session for RAG with enhanced metadata
-        logger.info("[PHASE1] Indexing turn %d for conversation %s", turn_index, conversation_id)
-        
         # Extract topics from question + final answer
         from .council import extract_topics, calculate_quality_metrics
         combined_text = request.content + " " + stage3_result.get('response', '')
         topics = await extract_topics(combined_text, max_topics=3)
-        
+
         # Calculate quality metrics from Stage 2 rankings
         quality_metrics = calculate_quality_metrics(
             stage2_results=stage2_results,
             label_to_model=metadata["label_to_model"],
         )
-        
-        # Index session with enhanced metadata
-        updated_conversation = storage.get_conversation(conversation_id)
-        turn_index = get_turn_index(updated_conversation) - 1
-        
-        rag_system.index_session(
+
+        # Index the session for RAG after the response is sent
+        background_tasks.add_task(
+            _index_council_turn,
             conversation_id,
             turn_index,
             request.content,
@@ -245,9 +331,6 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
             topics,
             quality_metrics,
         )
-        
-        # Refresh hybrid index after indexing
-        rag_system.refresh_hybrid_index()
 
         # Return the complete response with metadata
         return {
@@ -260,10 +343,8 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
             "evidence": evidence_pack.dict() if evidence_pack else None
         }
     else:
-        # Chat with Chairman
-        # Reload conversation to get the latest user message we just added
-        conversation = storage.get_conversation(conversation_id)
-        
+        # Chat with Chairman; conversation already includes the user
+        # message we just appended
         # PHASE 1: Rewrite query for better RAG retrieval
         from .council import rewrite_query
         rewritten_query = await rewrite_query(
@@ -282,9 +363,13 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
             chairman_model=chairman_model
         )
         
+        # Title generation overlapped with the chairman call; collect it now
+        if title_task:
+            storage.update_conversation_title(conversation_id, await title_task)
+
         # Add simple chat message
         storage.add_chat_message(conversation_id, response_dict["content"])
-        
+
         return {
             "type": "chat",
             "content": response_dict["content"],
@@ -293,10 +378,12 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
 
 
 @app.post("/api/conversations/{conversation_id}/message/stream")
-async def send_message_stream(conversation_id: str, request: SendMessageRequest):
+async def send_message_stream(conversation_id: str, http_request: Request):
     """
     Send a message and stream the response (Council or Chat).
     """
+    request = _decode_body(await http_request.body(), _send_message_decoder)
+
     # Check if conversation exists
     conversation = storage.get_conversation(conversation_id)
     if conversation is None:
@@ -309,7 +396,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     if mode == "auto":
         mode = "council" if is_first_message else "chat"
 
-    async def event_generator():
+    async def event_generator() -> AsyncIterator[bytes]:
         try:
             # Build attachment context if attachment_ids provided
             attachment_context = ""
@@ -325,7 +412,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 llm_content = f"{request.content}\n\n{attachment_context}"
             
             # Add user message (store only original content, not attachment text)
-            storage.add_user_message(conversation_id, request.content)
+            updated_conversation = storage.add_user_message(conversation_id, request.content)
 
             # Get model configuration from conversation metadata
             metadata = conversation.get("metadata", {})
@@ -343,42 +430,55 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 import uuid
                 run_id = str(uuid.uuid4())
                 
-                yield f"data: {json.dumps({'type': 'steward_start'})}\n\n"
+                yield _STEWARD_START
                 evidence_pack, steward_usage = await run_tool_steward_phase(request.content, run_id, chairman_model=chairman_model)
-                yield f"data: {json.dumps({'type': 'steward_complete', 'data': evidence_pack.dict(), 'usage': steward_usage})}\n\n"
-
-                # Stage 1: Collect responses (use llm_content with attachments)
-                yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-                stage1_results = await stage1_collect_responses(llm_content, models=council_models, evidence_pack=evidence_pack)
-                yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
+                yield _sse({'type': 'steward_complete', 'data': evidence_pack.dict(), 'usage': steward_usage})
+
+                # Stage 1: Collect responses (use llm_content with attachments),
+                # forwarding each model's answer as it lands instead of
+                # holding the whole batch for the slowest model
+                yield _STAGE1_START
+                stage1_results = []
+                async for stage1_result in stage1_collect_responses_iter(llm_content, models=council_models, evidence_pack=evidence_pack):
+                    stage1_results.append(stage1_result)
+                    yield _sse({'type': 'stage1_partial', 'model': stage1_result['model'], 'data': stage1_result})
+                yield _sse({'type': 'stage1_complete', 'data': stage1_results})
 
                 # Stage 2: Collect rankings
-                yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-                stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results, models=council_models)
+                yield _STAGE2_START
+                stage2_results, label_to_model, labeled_responses = await stage2_collect_rankings(request.content, stage1_results, models=council_models)
                 aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-                yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})}\n\n"
+                yield _sse({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})
 
                 # Calculate quality metrics for confidence scoring
                 from .council import calculate_quality_metrics
                 quality_metrics = calculate_quality_metrics(stage2_results, label_to_model)
 
                 # Stage 3: Synthesize final answer with confidence
-                yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-                stage3_result = await stage3_synthesize_final(request.content, stage1_results, stage2_results, label_to_model, quality_metrics, chairman_model=chairman_model)
-                yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+                yield _STAGE3_START
+                # Stream the chairman synthesis so the client sees tokens
+                # as they are generated instead of waiting for the full
+                # completion; the final event keeps its original shape
+                stage3_result = None
+                async for chunk in stage3_synthesize_final_stream(request.content, stage1_results, stage2_results, label_to_model, quality_metrics, chairman_model=chairman_model, labeled_responses=labeled_responses):
+                    if chunk.get("done"):
+                        stage3_result = chunk["data"]
+                    else:
+                        yield _sse({'type': 'stage3_delta', 'data': chunk['delta']})
+                yield _sse({'type': 'stage3_complete', 'data': stage3_result})
 
                 # Wait for title generation if it was started
                 if title_task:
                     title = await title_task
                     storage.update_conversation_title(conversation_id, title)
-                    yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                    yield _sse({'type': 'title_complete', 'data': {'title': title}})
 
                 # Save complete assistant message with metadata for analytics
                 council_metadata = {
                     "label_to_model": label_to_model,
                     "aggregate_rankings": aggregate_rankings
                 }
-                storage.add_assistant_message(
+                turn_index = storage.add_assistant_message(
                     conversation_id,
                     stage1_results,
                     stage2_results,
@@ -386,24 +486,19 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                     council_metadata  # For analytics tracking
                 )
 
-                # Calculate turn_index BEFORE using it
-                updated_conversation = storage.get_conversation(conversation_id)
-                turn_index = get_turn_index(updated_conversation) - 1
-                
-                # Index for RAG with enhanced metadata
-                logger.info("[PHASE1] Indexing turn %d for conversation %s", turn_index, conversation_id)
-                
                 # Extract topics from question + final answer
                 from .council import extract_topics
                 combined_text = request.content + " " + stage3_result.get('response', '')
                 topics = await extract_topics(combined_text, max_topics=3)
                 logger.info("[PHASE1] Topics extracted: %s", topics)
-                
-                # quality_metrics already calculated on line 327, reuse it
+
+                # quality_metrics already calculated during stage2, reuse it
                 logger.info("[PHASE1] Quality metrics: %s", quality_metrics)
-                
-                # Index session with enhanced metadata
-                rag_system.index_session(
+
+                # Index for RAG in a worker thread so the complete event
+                # streams out without waiting on embeddings
+                index_task = asyncio.create_task(asyncio.to_thread(
+                    _index_council_turn,
                     conversation_id,
                     turn_index,
                     request.content,
@@ -412,21 +507,17 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                     stage3_result,
                     topics,
                     quality_metrics,
-                )
-                logger.info("[PHASE1] Session indexed successfully")
-                
-                # Refresh hybrid index after indexing
-                rag_system.refresh_hybrid_index()
-                logger.info("[PHASE1] Hybrid index refreshed")
+                ))
+                _background_index_tasks.add(index_task)
+                index_task.add_done_callback(_background_index_tasks.discard)
             
             else:
                 # Chat mode
-                yield f"data: {json.dumps({'type': 'chat_start'})}\n\n"
+                yield _CHAT_START
                 
                 logger.info(f"[CHAT] Chat mode started for query: {request.content[:50]}...")
                 
-                # Reload conversation to get history
-                updated_conversation = storage.get_conversation(conversation_id)
+                # Conversation dict from add_user_message already has history
                 logger.info(f"[CHAT] Loaded conversation with {len(updated_conversation['messages'])} messages")
                 
                 # PHASE 2: Create Run Plan for budget-aware routing
@@ -439,7 +530,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 )
                 
                 # Send run plan to client for observability
-                yield f"data: {json.dumps({'type': 'run_plan', 'data': run_plan.to_dict()})}\n\n"
+                yield _sse({'type': 'run_plan', 'data': run_plan.to_dict()})
                 
                 # PHASE 1: Rewrite query for better RAG retrieval
                 from .council import rewrite_query
@@ -485,7 +576,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
                 logger.info(f"[CHAT] Saving chat message...")
                 storage.add_chat_message(conversation_id, response_dict["content"])
                 
-                yield f"data: {json.dumps({'type': 'chat_response', 'data': response_dict})}\n\n"
+                yield _sse({'type': 'chat_response', 'data': response_dict})
                 logger.info(f"[CHAT] Chat response sent to client")
 
             # Calculate total cost for this turn
@@ -518,7 +609,7 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             if warning_level is not None:
                 warning_pct = int(warning_level * 100)
                 logger.info(f"[BUDGET] Emitting warning at {warning_pct}% for conversation {conversation_id}")
-                yield f"data: {json.dumps({'type': 'budget_warning', 'data': {'threshold': warning_level, 'percentage': warning_pct}})}\n\n"
+                yield _sse({'type': 'budget_warning', 'data': {'threshold': warning_level, 'percentage': warning_pct}})
             
             # Get updated total cost
             updated_conv = storage.get_conversation(conversation_id)
@@ -528,11 +619,11 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             spent_pct = storage.get_budget_spent_percentage(conversation_id)
 
             # Send completion event with cost info and budget status
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'turn_cost': turn_cost, 'total_cost': total_cost, 'budget_spent_pct': spent_pct}})}\n\n"
+            yield _sse({'type': 'complete', 'data': {'turn_cost': turn_cost, 'total_cost': total_cost, 'budget_spent_pct': spent_pct}})
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse({'type': 'error', 'message': str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -567,18 +658,13 @@ async def upload_file(file: UploadFile = File(...)):
 # ATTACHMENT API (New unified file upload system)
 # =============================================================================
 
-@app.post("/api/attachments")
-async def create_attachment_endpoint(file: UploadFile = File(...)):
-    """
-    Upload a file and create an attachment.
-    Returns attachment_id and status. Extraction happens async.
-    """
-    content = await file.read()
-    mime_type = get_mime_type(file.filename, file.content_type)
-    
+async def _ingest_attachment(content: bytes, filename: str, content_type: str, sha256: str) -> Dict[str, Any]:
+    """Store, extract, and describe one uploaded file."""
+    mime_type = get_mime_type(filename, content_type)
+
     # Create attachment record (stores raw file)
-    attachment = create_attachment(content, file.filename, mime_type)
-    
+    attachment = create_attachment(content, filename, mime_type, sha256=sha256)
+
     # Check if this was a cache hit (already processed)
     if attachment.status in ("success", "partial"):
         return {
@@ -588,10 +674,10 @@ async def create_attachment_endpoint(file: UploadFile = File(...)):
             "cached": True,
             "warning": attachment.warning
         }
-    
+
     # Process the file (extraction)
-    result = await process_file(content, file.filename, mime_type)
-    
+    result = await process_file(content, filename, mime_type)
+
     # Update attachment with extraction result
     update_attachment_status(
         attachment.attachment_id,
@@ -601,17 +687,17 @@ async def create_attachment_endpoint(file: UploadFile = File(...)):
         error=result.error,
         stats=result.stats
     )
-    
+
     # Save extracted text
     if result.text:
         save_attachment_text(attachment.attachment_id, result.text)
-    
-    logger.info(f"[ATTACH] Processed {file.filename} -> {result.status}")
-    
+
+    logger.info(f"[ATTACH] Processed {filename} -> {result.status}")
+
     return {
         "attachment_id": attachment.attachment_id,
         "status": result.status,
-        "filename": file.filename,
+        "filename": filename,
         "cached": False,
         "method": result.method,
         "warning": result.warning,
@@ -620,6 +706,31 @@ async def create_attachment_endpoint(file: UploadFile = File(...)):
     }
 
 
+@app.post("/api/attachments")
+async def create_attachment_endpoint(file: List[UploadFile] = File(...)):
+    """
+    Upload one or more files and create attachments.
+
+    Repeated 'file' form parts batch into a single request; a lone file
+    keeps the original single-object response shape, a batch returns
+    {"attachments": [...]}. Extraction happens async.
+    """
+    contents = [await f.read() for f in file]
+
+    # Hash every upload up front; the batch helper fans SHA256 across
+    # threads when more than one file arrived
+    hashes = compute_sha256_batch(contents)
+
+    results = [
+        await _ingest_attachment(content, f.filename, f.content_type, sha256)
+        for f, content, sha256 in zip(file, contents, hashes)
+    ]
+
+    if len(results) == 1:
+        return results[0]
+    return {"attachments": results}
+
+
 @app.get("/api/attachments/{attachment_id}")
 async def get_attachment_endpoint(attachment_id: str):
     """
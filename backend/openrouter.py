@@ -1,11 +1,118 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
+import json
+import os
+import re
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+from typing import Any, AsyncIterator, Dict, List, Optional
+from .config import OPENROUTER_API_URL, REASONING_MODELS, get_api_key
 from .logger import logger
 
 
+# One long-lived client shared by every stage of a council run: connections
+# (and their TLS handshakes) are set up once and then reused across the
+# stage1/stage2 fan-outs and the steward/chairman calls, instead of paying
+# a fresh TCP+TLS round-trip per model call. Limits are sized for a full
+# council fan-out with headroom.
+_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Transient transport failures (dropped keepalive connections, resets) get
+# one retry before the call is reported as failed
+MAX_TRANSPORT_RETRIES = 1
+
+# 429 responses are retried with exponential backoff; each rate-limited
+# retry sleeps RATE_LIMIT_BASE_DELAY * 2^attempt (or Retry-After if longer)
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BASE_DELAY = 1.0
+
+# Throughput stops improving past a concurrency sweet spot, and
+# over-parallelizing just trades useful work for rate-limit backoff. This
+# caps in-flight OpenRouter requests across all stages of all runs.
+_request_sem: Optional[asyncio.Semaphore] = None
+_request_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    """Get (or create) the per-loop cap on in-flight OpenRouter requests.
+
+    Sized by OPENROUTER_MAX_INFLIGHT (default 16) and recreated if the
+    event loop changed, same as the shared client.
+    """
+    global _request_sem, _request_sem_loop
+    loop = asyncio.get_event_loop()
+    if _request_sem is None or _request_sem_loop is not loop:
+        _request_sem = asyncio.Semaphore(int(os.getenv("OPENROUTER_MAX_INFLIGHT", "16")))
+        _request_sem_loop = loop
+    return _request_sem
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get (or create) the shared AsyncClient for the running event loop.
+
+    The pool is bound to the loop its connections were opened in, so a new
+    client is created if the loop changed (e.g. separate asyncio.run calls
+    in scripts); under the FastAPI app there is a single loop and the
+    client lives for the life of the process.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_event_loop()
+    if _shared_client is None or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            limits=_CLIENT_LIMITS,
+            timeout=httpx.Timeout(120.0),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def _post_with_retries(
+    client: httpx.AsyncClient,
+    model: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    timeout: float
+) -> httpx.Response:
+    """POST to OpenRouter with bounded retries.
+
+    Transient transport errors get one retry; 429 responses get
+    exponential backoff (honoring a longer Retry-After header when the
+    server sends one). Any other response is returned as-is for the
+    caller's raise_for_status.
+    """
+    transport_retries = 0
+    for backoff_attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        while True:
+            try:
+                response = await client.post(
+                    OPENROUTER_API_URL,
+                    headers=headers,
+                    json=payload,
+                    timeout=timeout
+                )
+                break
+            except httpx.TransportError as e:
+                if transport_retries >= MAX_TRANSPORT_RETRIES:
+                    raise
+                transport_retries += 1
+                logger.warning(f"Transport error querying {model}, retrying: {e}")
+
+        if response.status_code != 429 or backoff_attempt >= MAX_RATE_LIMIT_RETRIES:
+            return response
+
+        delay = RATE_LIMIT_BASE_DELAY * (2 ** backoff_attempt)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+        logger.warning(f"Rate limited querying {model}, backing off {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    return response
+
+
 async def query_model(
     model: str,
     messages: List[Dict[str, str]],
@@ -23,7 +130,7 @@ async def query_model(
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
     headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Authorization": f"Bearer {get_api_key()}",
         "Content-Type": "application/json",
     }
 
@@ -33,37 +140,104 @@ async def query_model(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
+        client = get_shared_client()
+        # The semaphore is held through any backoff sleeps so a
+        # rate-limited window is not flooded by the remaining fan-out
+        async with _get_request_semaphore():
+            response = await _post_with_retries(client, model, headers, payload, timeout)
+        response.raise_for_status()
 
-            data = response.json()
-            message = data['choices'][0]['message']
+        data = response.json()
+        message = data['choices'][0]['message']
 
-            content = message.get('content', '')
-            reasoning = ""
-            
-            # Extract reasoning if model supports it
-            content, reasoning = extract_reasoning(content, message, model)
+        content = message.get('content', '')
+        reasoning = ""
 
-            # Extract usage if available
-            usage = data.get('usage', {})
+        # Extract reasoning if model supports it
+        content, reasoning = extract_reasoning(content, message, model)
 
-            return {
-                'content': content,
-                'reasoning_details': reasoning if reasoning else None,
-                'usage': usage
-            }
+        # Extract usage if available
+        usage = data.get('usage', {})
+
+        return {
+            'content': content,
+            'reasoning_details': reasoning if reasoning else None,
+            'usage': usage
+        }
 
     except Exception as e:
         logger.error(f"Error querying model {model}: {e}")
         return None
 
 
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a single model's completion via the OpenRouter API.
+
+    Yields {"delta": str} entries as tokens arrive, then a final
+    {"done": True, "content": full_text, "usage": {...}} entry. On
+    failure the final entry carries whatever content arrived before the
+    error (possibly empty), matching query_model's log-and-degrade style.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
+    """
+    headers = {
+        "Authorization": f"Bearer {get_api_key()}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": True,
+    }
+
+    parts: List[str] = []
+    usage: Dict[str, Any] = {}
+
+    try:
+        client = get_shared_client()
+        async with _get_request_semaphore():
+            async with client.stream(
+                "POST",
+                OPENROUTER_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Ignore SSE comments/keepalives; data lines carry JSON
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                    except ValueError:
+                        continue
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                    choices = chunk.get("choices") or []
+                    delta = choices[0].get("delta") or {} if choices else {}
+                    text = delta.get("content")
+                    if text:
+                        parts.append(text)
+                        yield {"delta": text}
+    except Exception as e:
+        logger.error(f"Error streaming model {model}: {e}")
+
+    yield {"done": True, "content": "".join(parts), "usage": usage}
+
+
 def extract_reasoning(content: str, message: Dict[str, Any], model: str) -> tuple[str, str]:
     """
     Extract reasoning from the response based on model capabilities.
@@ -76,9 +250,6 @@ def extract_reasoning(content: str, message: Dict[str, Any], model: str) -> tupl
     Returns:
         Tuple of (clean_content, extracted_reasoning)
     """
-    from .config import REASONING_MODELS
-    import re
-    
     # 1. Capability Check
     # If model is not in our registry, do not extract reasoning
     if model not in REASONING_MODELS:
@@ -138,13 +309,17 @@ async def query_models_parallel(
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
+    # The prompt is identical for every model, so a model listed twice
+    # would previously pay two identical calls only for the second result
+    # to overwrite the first in the response dict; issue one call per
+    # distinct model instead
+    unique_models = list(dict.fromkeys(models))
 
     # Create tasks for all models
-    tasks = [query_model(model, messages) for model in models]
+    tasks = [query_model(model, messages) for model in unique_models]
 
     # Wait for all to complete
     responses = await asyncio.gather(*tasks)
 
     # Map models to their responses
-    return {model: response for model, response in zip(models, responses)}
+    return {model: response for model, response in zip(unique_models, responses)}
@@ -5,7 +5,7 @@ import os
 
 from .hybrid_retrieval import HybridRetriever
 from .logger import logger
-from .config import RAG_SETTINGS
+from .config import RAG_SETTINGS, get_preset
 
 class CouncilRAG:
     def __init__(self, persist_path: str = "./data/chroma_db"):
@@ -168,8 +168,7 @@ class CouncilRAG:
         
         # Resolve budget from config
         if max_tokens is None:
-            default_key = RAG_SETTINGS["default_preset"]
-            requested = RAG_SETTINGS["presets"][default_key]["tokens"]
+            requested = get_preset(RAG_SETTINGS["default_preset"])["tokens"]
         else:
             requested = max_tokens
         
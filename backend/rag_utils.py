@@ -57,24 +57,20 @@ def detect_task_signal(query: str, has_files: bool = False) -> str:
     Returns:
         Task signal: "quick", "standard", or "research"
     """
-    query_lower = query.lower()
-    
     # Check for research indicators
     if has_files:
         return "research"
-    
+
     if len(query) > TASK_SIGNALS["research_query_length"]:
         return "research"
-    
-    for keyword in TASK_SIGNALS["research_keywords"]:
-        if keyword in query_lower:
-            return "research"
-    
+
+    if TASK_SIGNALS["research_re"].search(query):
+        return "research"
+
     # Check for quick indicators
-    for keyword in TASK_SIGNALS["quick_keywords"]:
-        if keyword in query_lower:
-            return "quick"
-    
+    if TASK_SIGNALS["quick_re"].search(query):
+        return "quick"
+
     # Default
     return "standard"
 
@@ -125,13 +125,17 @@ def list_conversations() -> List[Dict[str, Any]]:
     return conversations
 
 
-def add_user_message(conversation_id: str, content: str):
+def add_user_message(conversation_id: str, content: str) -> Dict[str, Any]:
     """
     Add a user message to a conversation.
 
     Args:
         conversation_id: Conversation identifier
         content: User message content
+
+    Returns:
+        The updated conversation dict, so callers can keep working with
+        it instead of re-reading the file
     """
     with ConversationLock.get_lock(conversation_id):
         conversation = get_conversation(conversation_id)
@@ -144,6 +148,7 @@ def add_user_message(conversation_id: str, content: str):
         })
 
         save_conversation(conversation)
+        return conversation
 
 
 def add_assistant_message(
@@ -152,7 +157,7 @@ def add_assistant_message(
     stage2: List[Dict[str, Any]],
     stage3: Dict[str, Any],
     metadata: Dict[str, Any] = None
-):
+) -> int:
     """
     Add an assistant message with all 3 stages to a conversation.
 
@@ -162,12 +167,24 @@ def add_assistant_message(
         stage2: List of model rankings
         stage3: Final synthesized response
         metadata: Optional metadata including label_to_model mapping for analytics
+
+    Returns:
+        Zero-based index of this council turn within the conversation
     """
     with ConversationLock.get_lock(conversation_id):
         conversation = get_conversation(conversation_id)
         if conversation is None:
             raise ValueError(f"Conversation {conversation_id} not found")
 
+        # Completed turns are counted incrementally so callers get the
+        # turn index without re-scanning the message list; conversations
+        # from before the counter existed are seeded with one recount
+        if "turn_count" not in conversation:
+            conversation["turn_count"] = sum(
+                1 for msg in conversation["messages"]
+                if msg.get("role") == "assistant" and "stage3" in msg
+            )
+
         conversation["messages"].append({
             "role": "assistant",
             "stage1": stage1,
@@ -175,17 +192,22 @@ def add_assistant_message(
             "stage3": stage3,
             "metadata": metadata or {}
         })
+        conversation["turn_count"] += 1
 
         save_conversation(conversation)
+        return conversation["turn_count"] - 1
 
 
-def add_chat_message(conversation_id: str, content: str):
+def add_chat_message(conversation_id: str, content: str) -> Dict[str, Any]:
     """
     Add a simple chat message (from assistant) to a conversation.
 
     Args:
         conversation_id: Conversation identifier
         content: The assistant's response text
+
+    Returns:
+        The updated conversation dict
     """
     with ConversationLock.get_lock(conversation_id):
         conversation = get_conversation(conversation_id)
@@ -198,6 +220,7 @@ def add_chat_message(conversation_id: str, content: str):
         })
 
         save_conversation(conversation)
+        return conversation
 
 
 def update_conversation_title(conversation_id: str, title: str):
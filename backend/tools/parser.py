@@ -1,6 +1,7 @@
-import json
 import logging
 import re
+
+import msgspec
 from typing import Dict, Any, Optional
 
 from pydantic import BaseModel, ValidationError
@@ -40,8 +41,9 @@ class ToolParser:
                 logger.warning("[Parser] No JSON found in response.")
                 return {"action": "no_tools", "reason": "output_parsing_failed"}
 
-            # 3. Parsing
-            data = json.loads(json_str)
+            # 3. Parsing (msgspec's C decoder; the steward JSON can
+            # carry sizable tool-call argument payloads)
+            data = msgspec.json.decode(json_str)
             
             # 4. Validation (Basic Structure)
             # We don't enforce strict schema here to allow for "repair" logic if needed,
@@ -56,7 +58,7 @@ class ToolParser:
             
             return data
 
-        except json.JSONDecodeError as e:
+        except msgspec.DecodeError as e:
             logger.error(f"[Parser] Invalid JSON: {e}")
             return {"action": "no_tools", "reason": "json_decode_error"}
         except Exception as e:
@@ -7,6 +7,8 @@ class ToolRegistry:
     """
     _tools: Dict[str, ToolDefinition] = {}
     _implementations: Dict[str, Callable] = {}
+    # Rendered Steward prompt block; invalidated whenever a tool registers
+    _prompt_cache: Optional[str] = None
 
     @classmethod
     def register(cls, 
@@ -28,6 +30,7 @@ class ToolRegistry:
             )
             cls._tools[name] = definition
             cls._implementations[name] = func
+            cls._prompt_cache = None
             return func
         return decorator
 
@@ -50,10 +53,17 @@ class ToolRegistry:
     def to_prompt_format(cls) -> str:
         """
         Render available tools for the Steward prompt.
+
+        The registry only changes when a tool registers, so the rendered
+        block is cached and rebuilt on the first call after a change
+        rather than per steward invocation.
         """
+        if cls._prompt_cache is not None:
+            return cls._prompt_cache
+
         if not cls._tools:
             return "No tools available."
-        
+
         lines = ["Available Tools:"]
         for tool in cls._tools.values():
             lines.append(f"- {tool.name}: {tool.description}")
@@ -61,4 +71,5 @@ class ToolRegistry:
             if tool.examples:
                 lines.append(f"  Example intents: {', '.join(tool.examples)}")
             lines.append("")
-        return "\n".join(lines)
+        cls._prompt_cache = "\n".join(lines)
+        return cls._prompt_cache
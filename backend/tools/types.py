@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # -------------------------------------------------------------------------
 # Enums and Types
@@ -113,6 +113,33 @@ class EvidencePack(BaseModel):
     limits: UsageLimits = Field(default_factory=UsageLimits)
     open_questions: List[str] = Field(default_factory=list)
 
+    # Cached render() output; private so it stays out of .dict() payloads
+    _rendered_summary: Optional[str] = PrivateAttr(default=None)
+
+    def render(self) -> str:
+        """
+        Render tool outputs and key facts as a prompt block with [sID]
+        citations. The pack is immutable once the Steward hands it off,
+        so the string is built once and reused by every stage (and any
+        Stage 1 retry) that needs the evidence in a prompt.
+        """
+        if self._rendered_summary is None:
+            lines = ["\nEVIDENCE FROM TOOL STEWARD:"]
+
+            for tool_run in self.tools_used:
+                if tool_run.status == "executed":
+                    lines.append(f"- {tool_run.tool_name}: {tool_run.output_summary}")
+                else:
+                    lines.append(f"- {tool_run.tool_name} (Rejected): {tool_run.output_summary}")
+
+            if self.key_facts:
+                lines.append("\nKEY FACTS:")
+                for fact in self.key_facts:
+                    lines.append(f"- {fact.fact} [s{fact.source_id}] (Confidence: {fact.confidence_score})")
+
+            self._rendered_summary = "\n".join(lines)
+        return self._rendered_summary
+
 # -------------------------------------------------------------------------
 # Registry Types
 # -------------------------------------------------------------------------